@@ -7,42 +7,112 @@ OR if Star Citizen is installed at the default RSI Launcher path.
 
 Override any path by setting it in a .env file at the repo root
 (copy .env.example to .env). Env vars also work if set in the shell.
+
+This is the only settings module: every pipeline script imports from
+config.settings, so the .env load and path setup run once per process.
 """
+import functools
 import os
+import re
 import sys
 from pathlib import Path
 
 # Repo root = three levels up from SCRIPTS/config/settings.py
-REPO_ROOT = Path(__file__).parent.parent.parent
+_REPO_ROOT_STR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+REPO_ROOT = Path(_REPO_ROOT_STR)
 
 # Default Star Citizen install location (RSI Launcher)
 _SC_DEFAULT = Path(r"C:\Program Files\Roberts Space Industries\StarCitizen\LIVE\Data.p4k")
 
 
 # ── Load .env from repo root (optional) ──────────────────────────────────────
+# KEY=value per line; value may be "double" or 'single' quoted. A # starts a
+# trailing comment only after whitespace, so paths like C:\Games#2\... keep
+# their tail. Blank and comment lines never match. The first of duplicate
+# keys wins.
+_ENV_RE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+    r"""("[^"\n]*"|'[^'\n]*'|[^\n]*?)(?:[ \t]+#[^\n]*)?[ \t]*$""",
+    re.M,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _parsed_env(path_str, mtime):
+    """Parse .env once per (path, mtime) -> {key: value}."""
+    with open(path_str, encoding="utf-8") as f:
+        text = f.read()
+    parsed = {}
+    for key, val in _ENV_RE.findall(text):
+        # Drop one pair of matching quotes with a single slice
+        if len(val) > 1 and val[0] in "\"'" and val[-1] == val[0]:
+            val = val[1:-1]
+        parsed.setdefault(key, val)
+    return parsed
+
+
 def _load_env():
-    env_file = REPO_ROOT / ".env"
-    if not env_file.exists():
+    env_file = os.path.join(_REPO_ROOT_STR, ".env")
+    try:
+        st = os.stat(env_file)
+    except OSError:
         return
-    for raw in env_file.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, _, val = line.partition("=")
-        os.environ.setdefault(key.strip(), val.strip().strip('"').strip("'"))
+    parsed = _parsed_env(env_file, st.st_mtime)
+    # Shell env wins over .env — only fill in keys the environment lacks
+    for key in parsed.keys() - os.environ.keys():
+        os.environ[key] = parsed[key]
 
 _load_env()
 
 
 # ── Paths — all default to repo-relative locations ───────────────────────────
-P4K_PATH    = Path(os.environ.get("SC_P4K_PATH",    str(REPO_ROOT / "Data.p4k")))
-OUTPUT_DIR  = Path(os.environ.get("SC_OUTPUT_DIR",  str(REPO_ROOT / "Data_Extraction")))
-REPORTS_DIR = Path(os.environ.get("SC_REPORTS_DIR", str(REPO_ROOT / "HTML")))
-LOGS_DIR    = Path(os.environ.get("SC_LOGS_DIR",    str(REPO_ROOT / "Data_Extraction" / "logs")))
+def _setting_str(env_var, *default_parts):
+    """Env var value if set, else REPO_ROOT/<default_parts> joined as a string."""
+    return os.environ.get(env_var) or os.path.join(_REPO_ROOT_STR, *default_parts)
+
+
+# *_STR forms are for subprocess args and os.path joins in tight loops;
+# the Path forms wrap the same string once.
+OUTPUT_DIR_STR  = _setting_str("SC_OUTPUT_DIR",  "Data_Extraction")
+REPORTS_DIR_STR = _setting_str("SC_REPORTS_DIR", "HTML")
+LOGS_DIR_STR    = _setting_str("SC_LOGS_DIR",    "Data_Extraction", "logs")
+
+OUTPUT_DIR  = Path(OUTPUT_DIR_STR)
+REPORTS_DIR = Path(REPORTS_DIR_STR)
+LOGS_DIR    = Path(LOGS_DIR_STR)
+
+# Every script writes into one of these — create them once here so the
+# pipeline scripts don't each need their own mkdir before writing
+for _d in (OUTPUT_DIR_STR, REPORTS_DIR_STR, LOGS_DIR_STR):
+    os.makedirs(_d, exist_ok=True)
 
-# Auto-detect: if configured path doesn't exist, try the default SC install
-if not P4K_PATH.exists() and _SC_DEFAULT.exists():
-    P4K_PATH = _SC_DEFAULT
+
+# DataCore dump worker processes (extractor.py). Each extra worker loads its
+# own copy of Game2.dcb (~75s and a few GB of RAM), so the default of 1 dumps
+# in the main process; SC_DUMP_WORKERS=N opts in on machines with RAM to spare.
+try:
+    DUMP_WORKERS = max(1, int(os.environ.get("SC_DUMP_WORKERS") or 1))
+except ValueError:
+    DUMP_WORKERS = 1
+
+
+@functools.lru_cache(maxsize=1)
+def get_p4k_path():
+    """
+    Resolve Data.p4k on first call, then return the cached Path.
+
+    Uses SC_P4K_PATH (default: Data.p4k in the repo root); if that file does
+    not exist, falls back to the default SC install. Deferred so scripts that
+    never open the P4K (the report generators) only stat it when they read
+    settings.GAME_VERSION in run(), and never at import or in pool workers;
+    `from config.settings import GAME_VERSION` would resolve it at import.
+    Module attributes P4K_PATH and P4K_DIR (the game install folder holding
+    build_manifest.id) resolve through here on first access.
+    """
+    path = Path(_setting_str("SC_P4K_PATH", "Data.p4k"))
+    if not os.path.isfile(path) and os.path.isfile(_SC_DEFAULT):
+        path = _SC_DEFAULT
+    return path
 
 
 # ── Game version string ───────────────────────────────────────────────────────
@@ -61,36 +131,48 @@ def _read_game_version():
          where only Data.p4k was copied to the repo root with no manifest
     """
     import json, datetime
-    manifest = P4K_PATH.parent / "build_manifest.id"
-    if manifest.exists():
-        try:
-            data = json.loads(manifest.read_text(encoding="utf-8")).get("Data", {})
-            branch = data.get("Branch", "")
-            tag    = data.get("Tag", "")
-            cl     = data.get("RequestedP4ChangeNum", "")
-
-            for prefix in ("sc-alpha-", "sc-"):
-                if branch.startswith(prefix):
-                    branch = branch[len(prefix):]
-                    break
-
-            tag_label = "live" if tag == "public" else tag
-
-            if branch and cl:
-                return f"{branch}-{tag_label}.{cl}"
-            v = data.get("Version", "")
-            if v:
-                return v
-        except Exception:
-            pass
+    p4k_path = get_p4k_path()
+    manifest = p4k_path.parent / "build_manifest.id"
+    # No exists() precheck: a missing manifest just raises inside the try
+    try:
+        data = json.loads(manifest.read_bytes()).get("Data", {})
+        branch = data.get("Branch", "")
+        tag    = data.get("Tag", "")
+        cl     = data.get("RequestedP4ChangeNum", "")
+
+        if branch.startswith("sc-alpha-"):
+            branch = branch.removeprefix("sc-alpha-")
+        else:
+            branch = branch.removeprefix("sc-")
+
+        tag_label = "live" if tag == "public" else tag
+
+        if branch and cl:
+            return f"{branch}-{tag_label}.{cl}"
+        v = data.get("Version", "")
+        if v:
+            return v
+    except Exception:
+        pass
 
     # No manifest — use Data.p4k modification date as a human-readable fallback
     try:
-        mtime = P4K_PATH.stat().st_mtime
+        mtime = p4k_path.stat().st_mtime
         date  = datetime.datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
         return f"p4k-{date}"
     except Exception:
         return "unknown"
 
 
-GAME_VERSION = _read_game_version()
+def __getattr__(name):
+    """Resolve P4K_PATH / P4K_DIR / GAME_VERSION on first access (PEP 562)."""
+    if name == "P4K_PATH":
+        value = get_p4k_path()
+    elif name == "P4K_DIR":
+        value = get_p4k_path().parent
+    elif name == "GAME_VERSION":
+        value = _read_game_version()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
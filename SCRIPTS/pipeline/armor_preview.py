@@ -4,13 +4,54 @@ Scans pu_armor + starwear/helmet items, extracts all stats,
 outputs a searchable/filterable self-contained HTML page.
 """
 
+import functools
+import html
+import io
+import math
+import os
+import pickle
+import re
 import sys
 from pathlib import Path
-from xml.etree import ElementTree as ET
 from collections import defaultdict
+from dataclasses import dataclass, field
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait,
+)
+
+# lxml's C parser is noticeably faster on thousands of small record files;
+# fall back to the stdlib ElementTree when it isn't installed.
+try:
+    from lxml import etree as ET
+    # Comments/PIs would otherwise show up in iter() with non-string tags
+    _PARSER = ET.XMLParser(remove_blank_text=True, remove_comments=True, remove_pis=True)
+except ImportError:
+    from xml.etree import ElementTree as ET
+    _PARSER = None
+
+
+def _prefetch(paths, threads=8):
+    """Yield (path, bytes or None) in input order, with the file reads
+    overlapped on a thread pool so many small reads don't queue one by one
+    on slow or network storage."""
+    def read(p):
+        try:
+            with open(p, "rb") as f:
+                return p, f.read()
+        except OSError:
+            return p, None
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        yield from pool.map(read, paths)
+
+
+def _read_root(path):
+    """Parse an XML file from one read() call and return its root element."""
+    with open(path, "rb") as f:
+        return ET.fromstring(f.read(), _PARSER)
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from config.settings import OUTPUT_DIR, REPORTS_DIR, GAME_VERSION
+from config import settings   # settings.GAME_VERSION: read on use, not at import
+from config.settings import OUTPUT_DIR, REPORTS_DIR, LOGS_DIR
 
 # Reuse helpers from ships_preview
 from pipeline.ships_preview import (
@@ -18,12 +59,16 @@ from pipeline.ships_preview import (
     build_localization_index,
     build_manufacturer_index,
     _get_display_name,
+    _source_sig,
 )
 
-RECORDS_DIR  = OUTPUT_DIR / "Data" / "Libs" / "foundry" / "records"
-ARMOR_BASE   = RECORDS_DIR / "entities" / "scitem" / "characters" / "human" / "armor" / "pu_armor"
-HELMET_DIR   = RECORDS_DIR / "entities" / "scitem" / "characters" / "human" / "starwear" / "helmet"
-DAMAGE_DIR   = RECORDS_DIR / "damage"
+RECORDS_DIR   = OUTPUT_DIR / "Data" / "Libs" / "foundry" / "records"
+ARMOR_BASE    = RECORDS_DIR / "entities" / "scitem" / "characters" / "human" / "armor" / "pu_armor"
+HELMET_DIR    = RECORDS_DIR / "entities" / "scitem" / "characters" / "human" / "starwear" / "helmet"
+DAMAGE_DIR    = RECORDS_DIR / "damage"
+MFR_DIR       = RECORDS_DIR / "scitemmanufacturer"
+CONTAINER_DIR = RECORDS_DIR / "inventorycontainers"
+LOC_INI       = OUTPUT_DIR / "Data" / "Localization" / "english" / "global.ini"
 
 # ── Slot display ──────────────────────────────────────────────────────────────
 
@@ -102,49 +147,72 @@ MFR_NAMES = {
 
 DMG_KEYS = ["Physical", "Energy", "Distortion", "Thermal", "Biochemical", "Stun"]
 
+# tag -> DMG_KEYS entry (or None), filled on first sight of each tag so the
+# keyword match runs once per distinct tag instead of once per element
+_DMG_RE      = re.compile("|".join(DMG_KEYS))
+_DMG_TAG_MAP = {}
+
+def _dmg_key(tag):
+    try:
+        return _DMG_TAG_MAP[tag]
+    except KeyError:
+        m = _DMG_RE.search(tag)
+        key = _DMG_TAG_MAP[tag] = m.group(0) if m else None
+        return key
+
 def build_dmg_res_index():
     """UUID -> {Physical: %, Energy: %, ..., Force: %} where % = (1-mult)*100."""
     idx = {}
-    for f in DAMAGE_DIR.glob("*.xml"):
+    for f, data in _prefetch(DAMAGE_DIR.glob("*.xml")):
+        if data is None:
+            continue
         try:
-            root = ET.parse(f).getroot()
-            ref  = root.get("__id")
-            if not ref:
-                continue
+            # Stream the file: attributes are read on "start", each element is
+            # cleared on "end" so the full tree is never held in memory
+            ref = None
             res = {}
-            for el in root.iter():
+            for event, el in ET.iterparse(io.BytesIO(data), events=("start", "end")):
+                if event == "end":
+                    el.clear()
+                    continue
+                if ref is None:
+                    ref = el.get("__id") or ""   # first start event = root
+                    if not ref:
+                        break
                 tag  = el.tag
                 mult = el.get("Multiplier")
                 if mult:
-                    for key in DMG_KEYS:
-                        if key in tag:
-                            try:
-                                res[key] = round((1.0 - float(mult)) * 100, 1)
-                            except (ValueError, TypeError):
-                                pass
-                            break
+                    key = _dmg_key(tag)
+                    if key:
+                        try:
+                            res[key] = round((1.0 - float(mult)) * 100, 1)
+                        except (ValueError, TypeError):
+                            pass
                 force = el.get("impactForceResistance")
                 if force:
                     try:
                         res["Force"] = round((1.0 - float(force)) * 100, 1)
                     except (ValueError, TypeError):
                         pass
-            idx[ref] = res
+            if ref:
+                idx[ref] = res
         except Exception:
             pass
     print(f"  {len(idx)} damage resistance macros indexed")
     return idx
 
 
-def _get_container_scu(uuid, uuid_idx):
-    """Resolve an InventoryContainer UUID -> microSCU int (0 if not found)."""
-    if not uuid or uuid == "00000000-0000-0000-0000-000000000000":
-        return 0
-    entry = uuid_idx.get(uuid)
+# Many backpacks share the same few container records — memoize the parse by
+# UUID against the index last passed in (cache dropped if the index changes)
+_CONTAINER_UUID_IDX = {}
+
+@functools.lru_cache(maxsize=4096)
+def _container_scu(uuid):
+    entry = _CONTAINER_UUID_IDX.get(uuid)
     if not entry:
         return 0
     try:
-        root = ET.parse(entry["path"]).getroot()
+        root = _read_root(entry["path"])
         for el in root.iter():
             v = el.get("microSCU")
             if v:
@@ -154,193 +222,396 @@ def _get_container_scu(uuid, uuid_idx):
     return 0
 
 
+def _get_container_scu(uuid, uuid_idx):
+    """Resolve an InventoryContainer UUID -> microSCU int (0 if not found)."""
+    global _CONTAINER_UUID_IDX
+    if not uuid or uuid == "00000000-0000-0000-0000-000000000000":
+        return 0
+    if uuid_idx is not _CONTAINER_UUID_IDX:
+        _CONTAINER_UUID_IDX = uuid_idx
+        _container_scu.cache_clear()
+    return _container_scu(uuid)
+
+
+# tag -> is it a suit armor signature entry? (same first-sight caching)
+_SIG_TAG_MAP = {}
+
+def _is_sig_tag(tag):
+    try:
+        return _SIG_TAG_MAP[tag]
+    except KeyError:
+        hit = _SIG_TAG_MAP[tag] = "ItemSuitArmorSignatureParams" in tag
+        return hit
+
+
 # ── Armor item parser ─────────────────────────────────────────────────────────
 
+@dataclass(slots=True)
+class ArmorInfo:
+    """One parsed armor item. Slotted, so no per-instance __dict__."""
+    file:          str
+    name:          str   = ""
+    slot:          str   = "Other"
+    subtype:       str   = ""
+    tier:          str   = ""      # "heavy" / "medium" / "light" / ""
+    mfr:           str   = ""
+    micro_scu:     int   = 0
+    dmg:           dict  = field(default_factory=dict)
+    temp_min:      float | None = None
+    temp_max:      float | None = None
+    rad_cap:       float | None = None
+    rad_rate:      float | None = None
+    sigs:          list  = field(default_factory=list)
+    container_scu: int   = 0
+    # HTML-ready forms, derived once at the end of parse_armor_item
+    name_html:     str   = ""
+    name_lower:    str   = ""
+    mfr_html:      str   = ""
+
+# Section readers: each fills its part of info from the element that starts
+# the section. Same signature so they can be dispatched from one table.
+
+def _read_attach(el, info, path, idx):
+    uuid_idx, mfr_idx, loc_idx, dmg_idx = idx
+    typ     = el.get("Type", "")
+    subtype = el.get("SubType", "")
+    mfr_ref = el.get("Manufacturer", "")
+
+    info.slot    = SLOT_FROM_TYPE.get(typ, "Other")
+    info.subtype = subtype if subtype not in ("UNDEFINED", "") else ""
+    info.tier    = _normalize_tier(subtype)
+
+    # Backpacks in heavy/light/medium subdirs are tagged "Personal" by the
+    # game regardless of set — infer tier from parent directory path instead
+    if info.slot == "Backpack" and not info.tier:
+        parts = [p.lower() for p in path.parts]
+        if "heavy" in parts:
+            info.tier = "heavy"
+        elif "medium" in parts:
+            info.tier = "medium"
+        elif "light" in parts:
+            info.tier = "light"
+
+    # Manufacturer
+    mfr_code = mfr_idx.get(mfr_ref, "")
+    info.mfr = MFR_NAMES.get(mfr_code, mfr_code) if mfr_code else ""
+
+    # Display name via Localization child
+    info.name = _get_display_name(el, loc_idx)
+
+    # Item occupancy (inline microSCU)
+    for sub in el.iter():
+        v = sub.get("microSCU")
+        if v:
+            try:
+                info.micro_scu = int(v)
+            except (ValueError, TypeError):
+                pass
+            break
+
+
+def _read_suit(el, info, path, idx):
+    dmg_idx = idx[3]
+    # Damage resistance UUID
+    dmg_ref = el.get("damageResistance", "")
+    if dmg_ref and dmg_ref != "00000000-0000-0000-0000-000000000000":
+        info.dmg = dmg_idx.get(dmg_ref, {})
+
+    # Signatures (inline children)
+    for sig_el in el.iter():
+        if _is_sig_tag(sig_el.tag):
+            sig_type    = sig_el.get("signatureType", "")
+            emission    = sig_el.get("signatureEmission", "")
+            reduc_w     = sig_el.get("signatureReductionWeighted", "")
+            reduc_a     = sig_el.get("signatureReductionAbsolute", "")
+            if sig_type:
+                try:
+                    info.sigs.append({
+                        "type":      sig_type,
+                        "emission":  float(emission)  if emission  else 0.0,
+                        "reduc_w":   float(reduc_w)   if reduc_w   else 0.0,
+                        "reduc_a":   float(reduc_a)   if reduc_a   else 0.0,
+                    })
+                except (ValueError, TypeError):
+                    pass
+
+
+def _read_clothing(el, info, path, idx):
+    for sub in el.iter():
+        # Temperature
+        if "TemperatureResistance" in sub.tag:
+            try:
+                info.temp_min = float(sub.get("MinResistance", ""))
+                info.temp_max = float(sub.get("MaxResistance", ""))
+            except (ValueError, TypeError):
+                pass
+        # Radiation
+        if "RadiationResistance" in sub.tag:
+            try:
+                info.rad_cap  = float(sub.get("MaximumRadiationCapacity", ""))
+                info.rad_rate = float(sub.get("RadiationDissipationRate", ""))
+            except (ValueError, TypeError):
+                pass
+
+
+def _read_container(el, info, path, idx):
+    container_ref = el.get("containerParams", "")
+    info.container_scu = _get_container_scu(container_ref, idx[0])
+
+
+_SECTION_READERS = {
+    "attach":    _read_attach,
+    "suit":      _read_suit,
+    "clothing":  _read_clothing,
+    "container": _read_container,
+}
+
+# (tag, __polymorphicType) -> tuple of section names it opens ("loc" marks a
+# Localization element). Classified once per distinct pair, then a dict hit.
+_SECTION_CACHE = {}
+
+def _sections(tag, pt):
+    try:
+        return _SECTION_CACHE[tag, pt]
+    except KeyError:
+        pass
+    secs = []
+    if pt == "SItemDefinition" or tag == "AttachDef":
+        secs.append("attach")
+    if "SCItemSuitArmorParams" in tag or "SCItemSuitArmorParams" in pt:
+        secs.append("suit")
+    if "SCItemClothingParams" in tag or "SCItemClothingParams" in pt:
+        secs.append("clothing")
+    if "SCItemInventoryContainerComponentParams" in tag or \
+       "SCItemInventoryContainerComponentParams" in pt:
+        secs.append("container")
+    if "Localization" in tag:
+        secs.append("loc")
+    secs = _SECTION_CACHE[tag, pt] = tuple(secs)
+    return secs
+
+
+# With lxml, one compiled XPath picks out (in document order) only the elements
+# the walk below can act on — any that _sections() could classify, plus those
+# carrying a displayName — so the Python loop skips everything else. The
+# stdlib fallback has no XPath and walks root.iter().
+if _PARSER is not None:
+    _CANDIDATES_XP = ET.XPath(
+        "descendant-or-self::*[@__polymorphicType or @displayName or self::AttachDef"
+        " or contains(name(), 'SCItemSuitArmorParams')"
+        " or contains(name(), 'SCItemClothingParams')"
+        " or contains(name(), 'SCItemInventoryContainerComponentParams')"
+        " or contains(name(), 'Localization')]"
+    )
+else:
+    _CANDIDATES_XP = None
+
+
 def parse_armor_item(path, uuid_idx, mfr_idx, loc_idx, dmg_idx):
-    """Parse one armor XML, return info dict or None."""
+    """Parse one armor XML, return ArmorInfo or None."""
     try:
-        root = ET.parse(path).getroot()
+        root = _read_root(path)
     except Exception:
         return None
 
-    info = {
-        "file":          path.stem,
-        "name":          "",
-        "slot":          "Other",
-        "subtype":       "",
-        "tier":          "",   # "heavy" / "medium" / "light" / ""
-        "mfr":           "",
-        "micro_scu":     0,
-        "dmg":           {},
-        "temp_min":      None,
-        "temp_max":      None,
-        "rad_cap":       None,
-        "rad_rate":      None,
-        "sigs":          [],
-        "container_scu": 0,
-    }
-
-    # ── AttachDef ──────────────────────────────────────────────────────────────
-    for el in root.iter():
-        pt = el.get("__polymorphicType", "")
-        if pt == "SItemDefinition" or el.tag == "AttachDef":
-            typ     = el.get("Type", "")
-            subtype = el.get("SubType", "")
-            mfr_ref = el.get("Manufacturer", "")
-
-            info["slot"]    = SLOT_FROM_TYPE.get(typ, "Other")
-            info["subtype"] = subtype if subtype not in ("UNDEFINED", "") else ""
-            info["tier"]    = _normalize_tier(subtype)
-
-            # Backpacks in heavy/light/medium subdirs are tagged "Personal" by the
-            # game regardless of set — infer tier from parent directory path instead
-            if info["slot"] == "Backpack" and not info["tier"]:
-                parts = [p.lower() for p in path.parts]
-                if "heavy" in parts:
-                    info["tier"] = "heavy"
-                elif "medium" in parts:
-                    info["tier"] = "medium"
-                elif "light" in parts:
-                    info["tier"] = "light"
-
-            # Manufacturer
-            mfr_code = mfr_idx.get(mfr_ref, "")
-            info["mfr"] = MFR_NAMES.get(mfr_code, mfr_code) if mfr_code else ""
-
-            # Display name via Localization child
-            info["name"] = _get_display_name(el, loc_idx)
-
-            # Item occupancy (inline microSCU)
-            for sub in el.iter():
-                v = sub.get("microSCU")
-                if v:
-                    try:
-                        info["micro_scu"] = int(v)
-                    except (ValueError, TypeError):
-                        pass
-                    break
-            break
+    info = ArmorInfo(file=path.stem)
+    idx = (uuid_idx, mfr_idx, loc_idx, dmg_idx)
+
+    # Single walk over the tree: each section is read from the first element
+    # that opens it, same as separate passes, and the walk stops once every
+    # section has been seen and the name is settled.
+    pending = set(_SECTION_READERS)
+    fallback_name  = ""      # first usable SCItemPurchasableParams.displayName
+    is_placeholder = None    # set by the first Localization element with a key
+
+    elements = _CANDIDATES_XP(root) if _CANDIDATES_XP is not None else root.iter()
+    for el in elements:
+        for sec in _sections(el.tag, el.get("__polymorphicType", "")):
+            if sec in pending:
+                pending.discard(sec)
+                _SECTION_READERS[sec](el, info, path, idx)
+            elif sec == "loc" and is_placeholder is None:
+                # Whether the XML's own loc key resolves to PLACEHOLDER
+                k = el.get("Name", "")
+                if k and k.startswith("@") and k not in ("@LOC_UNINITIALIZED", "@LOC_EMPTY"):
+                    raw = loc_idx.get(k[1:].lower(), "")
+                    is_placeholder = "PLACEHOLDER" in raw.upper()
 
-    # Fallback name from SCItemPurchasableParams.displayName
-    if not info["name"]:
-        for el in root.iter():
+        # Fallback name from SCItemPurchasableParams.displayName
+        if not fallback_name:
             dn = el.get("displayName", "")
             if dn and dn.startswith("@") and dn not in ("@LOC_UNINITIALIZED", "@LOC_EMPTY"):
-                key = dn[1:].lower()
-                name = loc_idx.get(key, "")
+                name = loc_idx.get(dn[1:].lower(), "")
                 if name and "PLACEHOLDER" not in name.upper():
-                    info["name"] = name
-                    break
-
-    # If still no name, check whether the XML's loc key explicitly resolves to PLACEHOLDER
-    # (now returns "" from _get_display_name). Those are dev-only items — skip entirely.
-    # Items with genuinely missing translations get filename fallback instead.
-    if not info["name"]:
-        is_placeholder = False
-        for el in root.iter():
-            if "Localization" in el.tag:
-                k = el.get("Name", "")
-                if k and k.startswith("@") and k not in ("@LOC_UNINITIALIZED", "@LOC_EMPTY"):
-                    raw = loc_idx.get(k[1:].lower(), "")
-                    if "PLACEHOLDER" in raw.upper():
-                        is_placeholder = True
-                    break
-        if is_placeholder:
-            return None  # filter dev-only items
-        info["name"] = path.stem  # real item, just missing translation
-
-    # ── SCItemSuitArmorParams ──────────────────────────────────────────────────
-    for el in root.iter():
-        pt = el.get("__polymorphicType", "")
-        if "SCItemSuitArmorParams" in el.tag or "SCItemSuitArmorParams" in pt:
-            # Damage resistance UUID
-            dmg_ref = el.get("damageResistance", "")
-            if dmg_ref and dmg_ref != "00000000-0000-0000-0000-000000000000":
-                info["dmg"] = dmg_idx.get(dmg_ref, {})
-
-            # Signatures (inline children)
-            for sig_el in el.iter():
-                if "ItemSuitArmorSignatureParams" in sig_el.tag:
-                    sig_type    = sig_el.get("signatureType", "")
-                    emission    = sig_el.get("signatureEmission", "")
-                    reduc_w     = sig_el.get("signatureReductionWeighted", "")
-                    reduc_a     = sig_el.get("signatureReductionAbsolute", "")
-                    if sig_type:
-                        try:
-                            info["sigs"].append({
-                                "type":      sig_type,
-                                "emission":  float(emission)  if emission  else 0.0,
-                                "reduc_w":   float(reduc_w)   if reduc_w   else 0.0,
-                                "reduc_a":   float(reduc_a)   if reduc_a   else 0.0,
-                            })
-                        except (ValueError, TypeError):
-                            pass
-            break
+                    fallback_name = name
 
-    # ── SCItemClothingParams ───────────────────────────────────────────────────
-    for el in root.iter():
-        pt = el.get("__polymorphicType", "")
-        if "SCItemClothingParams" in el.tag or "SCItemClothingParams" in pt:
-            for sub in el.iter():
-                # Temperature
-                if "TemperatureResistance" in sub.tag:
-                    try:
-                        info["temp_min"] = float(sub.get("MinResistance", ""))
-                        info["temp_max"] = float(sub.get("MaxResistance", ""))
-                    except (ValueError, TypeError):
-                        pass
-                # Radiation
-                if "RadiationResistance" in sub.tag:
-                    try:
-                        info["rad_cap"]  = float(sub.get("MaximumRadiationCapacity", ""))
-                        info["rad_rate"] = float(sub.get("RadiationDissipationRate", ""))
-                    except (ValueError, TypeError):
-                        pass
+        if not pending and (info.name or fallback_name):
             break
 
-    # ── Inventory container (backpacks) ───────────────────────────────────────
-    for el in root.iter():
-        pt = el.get("__polymorphicType", "")
-        if "SCItemInventoryContainerComponentParams" in el.tag or \
-           "SCItemInventoryContainerComponentParams" in pt:
-            container_ref = el.get("containerParams", "")
-            info["container_scu"] = _get_container_scu(container_ref, uuid_idx)
-            break
+    # Items whose own loc key resolves to PLACEHOLDER (now "" from
+    # _get_display_name) are dev-only — skip entirely. Items with genuinely
+    # missing translations get filename fallback instead.
+    if not info.name:
+        info.name = fallback_name
+    if not info.name:
+        if is_placeholder:
+            return None  # filter dev-only items
+        info.name = path.stem  # real item, just missing translation
+
+    # HTML-ready forms, derived once here rather than on every render
+    info.name_html  = html.escape(info.name)
+    info.name_lower = info.name_html.lower()
+    info.mfr_html   = html.escape(info.mfr or "Unknown")
 
     return info
 
 
+# ── Parallel parse ────────────────────────────────────────────────────────────
+# Each armor file is independent, so parsing fans out over a process pool.
+# The indexes are handed to each worker once via the pool initializer rather
+# than pickled with every task.
+
+_WORKER_IDX = ()
+
+def _init_worker(uuid_idx, mfr_idx, loc_idx, dmg_idx):
+    global _WORKER_IDX
+    _WORKER_IDX = (uuid_idx, mfr_idx, loc_idx, dmg_idx)
+
+
+def _parse_in_worker(path):
+    return parse_armor_item(path, *_WORKER_IDX)
+
+
+# Below this many files (e.g. a mostly-cached rerun) starting workers and
+# unpickling the indexes into each costs more than parsing in-process
+_POOL_MIN_FILES = 200
+_CHUNKSIZE      = 32
+
+
+def _parse_all(paths, idx):
+    """Yield parse_armor_item() for each path, in order: in-process for a
+    handful of files, else on a pool with no more workers than chunks."""
+    workers = min(61, os.cpu_count() or 1,   # 61 = Windows process pool limit
+                  math.ceil(len(paths) / _CHUNKSIZE))
+    if len(paths) < _POOL_MIN_FILES or workers < 2:
+        for path in paths:
+            yield parse_armor_item(path, *idx)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=idx) as pool:
+        yield from pool.map(_parse_in_worker, paths, chunksize=_CHUNKSIZE)
+
+
+# ── Parse cache ───────────────────────────────────────────────────────────────
+# {path: ((mtime_ns, size), info)} from the previous run, valid while the game
+# version and every index the parse reads from are unchanged. Bump
+# _CACHE_VERSION whenever the ArmorInfo layout changes.
+
+_CACHE_FILE    = LOGS_DIR / ".armor_cache.pkl"
+_CACHE_VERSION = 2
+
+# Names come from global.ini, makers from scitemmanufacturer + MFR_NAMES,
+# resistances from damage/, backpack capacity from the container records
+_CACHE_SOURCES = (LOC_INI, MFR_DIR, DAMAGE_DIR, CONTAINER_DIR)
+
+
+def _cache_key():
+    # One signature per source, so a missing one just reads as None
+    return (_CACHE_VERSION, settings.GAME_VERSION,
+            tuple(_source_sig([src]) for src in _CACHE_SOURCES),
+            tuple(sorted(MFR_NAMES.items())))
+
+
+def _load_cache(key):
+    try:
+        with open(_CACHE_FILE, "rb") as f:
+            data = pickle.load(f)
+        if data.get("key") == key:
+            return data["entries"]
+    except Exception:
+        pass
+    return {}
+
+
+def _save_cache(entries, key):
+    tmp = _CACHE_FILE.with_suffix(".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump({"key": key, "entries": entries},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, _CACHE_FILE)
+    except Exception:
+        pass
+
+
 # ── Scanner ───────────────────────────────────────────────────────────────────
 
 # Skip patterns for non-player variants
 _SKIP_PATTERNS = ("_nodraw", "_ai_", "_npc_", "_s42_", "_mannequin")
 _SKIP_PREFIXES = frozenset({"entityclassdefinition", "backpack_nodraw"})
+# All skip substrings as one alternation — a single C-level scan per name
+_SKIP_RE = re.compile("|".join(map(re.escape, _SKIP_PATTERNS)))
 
 def _should_skip(stem):
     s = stem.lower()
-    if s in _SKIP_PREFIXES:
-        return True
-    return any(p in s for p in _SKIP_PATTERNS)
+    return s in _SKIP_PREFIXES or _SKIP_RE.search(s) is not None
+
+
+def _scan_xml(base):
+    """Every non-skipped *.xml under base, recursively, as a sorted Path list.
+
+    Directories are listed with os.scandir on a small thread pool so the
+    listing syscalls overlap — this matters on network/SMB checkouts, and
+    costs nothing on a local disk. Sorted once at the end for stable output.
+    """
+    if not os.path.isdir(base):
+        return []
+
+    def list_dir(d):
+        files, subdirs = [], []
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif (os.path.normcase(entry.name).endswith(".xml")
+                          and not _should_skip(entry.name[:-4])):
+                        files.append(entry.path)
+        except OSError:
+            pass
+        return files, subdirs
+
+    found = []
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        pending = {pool.submit(list_dir, str(base))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                files, subdirs = fut.result()
+                found.extend(files)
+                pending.update(pool.submit(list_dir, d) for d in subdirs)
+    return sorted(map(Path, found))
 
 
 def scan_all_armor():
     """Return list of armor XML paths from pu_armor and starwear/helmet."""
-    paths = []
-    # pu_armor subtree
-    if ARMOR_BASE.exists():
-        for f in sorted(ARMOR_BASE.rglob("*.xml")):
-            if not _should_skip(f.stem):
-                paths.append(f)
-    # starwear helmets
-    if HELMET_DIR.exists():
-        for f in sorted(HELMET_DIR.rglob("*.xml")):
-            if not _should_skip(f.stem):
-                paths.append(f)
-    return paths
+    # pu_armor subtree, then starwear helmets
+    return _scan_xml(ARMOR_BASE) + _scan_xml(HELMET_DIR)
 
 
 # ── HTML generation ───────────────────────────────────────────────────────────
 
+# Short damage labels for the resistance bars
+_DMG_SHORT = {
+    "Physical": "Phys", "Energy": "Enrg", "Distortion": "Dist",
+    "Thermal": "Thrm", "Biochemical": "Bio", "Stun": "Stun",
+}
+
+# Tier filter tabs: (data-tier, label) in display order, and their colors
+_TIER_TABS       = (("light", "Light"), ("medium", "Medium"), ("heavy", "Heavy"))
+_TIER_TAB_COLORS = {"light": "#3498db", "medium": "#e67e22", "heavy": "#c0392b"}
+
+
 def _tier_badge(subtype):
     if not subtype:
         return ""
@@ -348,89 +619,98 @@ def _tier_badge(subtype):
     return f'<span class="tier" style="background:{color}">{subtype}</span>'
 
 
+def _bar_template(bar_color):
+    return (
+        '<div class="bar-row">'
+        '<span class="bar-lbl">{label}</span>'
+        '<div class="bar-bg"><div class="bar-fill" style="width:{width:.0f}%;background:' + bar_color + '"></div></div>'
+        '<span class="bar-val">{pct:.0f}%</span>'
+        '</div>'
+    ).format
+
+# One pre-built template per bar color threshold (>=35 green, >=20 orange, else blue)
+_BAR_GREEN  = _bar_template("#27ae60")
+_BAR_ORANGE = _bar_template("#e67e22")
+_BAR_BLUE   = _bar_template("#3498db")
+
+
 def _dmg_bar(pct, label):
     """Render a single damage resistance bar."""
     if pct is None:
         return ""
-    bar_color = "#27ae60" if pct >= 35 else "#e67e22" if pct >= 20 else "#3498db"
-    return (
-        f'<div class="bar-row">'
-        f'<span class="bar-lbl">{label}</span>'
-        f'<div class="bar-bg"><div class="bar-fill" style="width:{min(pct,100):.0f}%;background:{bar_color}"></div></div>'
-        f'<span class="bar-val">{pct:.0f}%</span>'
-        f'</div>'
-    )
+    fmt = _BAR_GREEN if pct >= 35 else _BAR_ORANGE if pct >= 20 else _BAR_BLUE
+    return fmt(label=label, width=min(pct, 100), pct=pct)
 
 
 def item_to_html(item):
-    if not item or item["slot"] == "Other":
+    if not item or item.slot == "Other":
         return ""
 
-    slot   = item["slot"]
-    name   = item["name"] or item["file"]
-    subtype = item["subtype"]
-    mfr    = item["mfr"] or "Unknown"
+    slot   = item.slot
+    name   = item.name_html
+    subtype = item.subtype
+    mfr    = item.mfr_html
 
     # Header badges
     tier_badge = _tier_badge(subtype)
     size_badge = (
-        f'<span class="stat-chip">{item["micro_scu"]:,} µSCU</span>'
-        if item["micro_scu"] > 0 else ""
+        f'<span class="stat-chip">{item.micro_scu:,} µSCU</span>'
+        if item.micro_scu > 0 else ""
     )
 
     # Damage resistance section
-    dmg = item["dmg"]
+    dmg = item.dmg
     dmg_html = ""
     if dmg:
-        bars = ""
-        for key in ["Physical", "Energy", "Distortion", "Thermal", "Biochemical", "Stun"]:
+        bar_parts = []
+        for key in DMG_KEYS:
             v = dmg.get(key)
             if v is not None:
-                short = {"Physical": "Phys", "Energy": "Enrg", "Distortion": "Dist",
-                         "Thermal": "Thrm", "Biochemical": "Bio", "Stun": "Stun"}.get(key, key)
-                bars += _dmg_bar(v, short)
+                bar_parts.append(_dmg_bar(v, _DMG_SHORT[key]))
         force = dmg.get("Force")
         if force is not None:
-            bars += _dmg_bar(force, "Impact")
+            bar_parts.append(_dmg_bar(force, "Impact"))
+        bars = "".join(bar_parts)
         if bars:
             dmg_html = f'<div class="stat-section"><div class="stat-title">Damage Resistance</div>{bars}</div>'
 
     # Temperature section
     temp_html = ""
-    if item["temp_min"] is not None and item["temp_max"] is not None:
+    if item.temp_min is not None and item.temp_max is not None:
         temp_html = (
             f'<div class="stat-section">'
             f'<div class="stat-title">Temperature</div>'
             f'<div class="kv-grid">'
-            f'<span class="k">Min</span><span class="v">{item["temp_min"]:g} °C</span>'
-            f'<span class="k">Max</span><span class="v">{item["temp_max"]:g} °C</span>'
+            f'<span class="k">Min</span><span class="v">{item.temp_min:g} °C</span>'
+            f'<span class="k">Max</span><span class="v">{item.temp_max:g} °C</span>'
             f'</div></div>'
         )
 
     # Radiation section
     rad_html = ""
-    if item["rad_cap"] is not None:
+    if item.rad_cap is not None:
         rad_html = (
             f'<div class="stat-section">'
             f'<div class="stat-title">Radiation</div>'
             f'<div class="kv-grid">'
-            f'<span class="k">Capacity</span><span class="v">{item["rad_cap"]:g}</span>'
-            f'<span class="k">Diss.Rate</span><span class="v">{item["rad_rate"]:g}/s</span>'
+            f'<span class="k">Capacity</span><span class="v">{item.rad_cap:g}</span>'
+            f'<span class="k">Diss.Rate</span><span class="v">{item.rad_rate:g}/s</span>'
             f'</div></div>'
         )
 
     # Signatures
     sig_html = ""
-    if item["sigs"]:
-        rows = ""
-        for s in item["sigs"]:
+    if item.sigs:
+        row_parts = []
+        for s in item.sigs:
             em = s["emission"]
             rw = s["reduc_w"]
             ra = s["reduc_a"]
-            rows += (
+            row_parts.append(
                 f'<span class="k">{s["type"]}</span>'
                 f'<span class="v">+{em:g} / -{rw:g}w -{ra:g}a</span>'
             )
+        rows = "".join(row_parts)
         sig_html = (
             f'<div class="stat-section">'
             f'<div class="stat-title">Signatures (emit / reduce)</div>'
@@ -439,8 +719,8 @@ def item_to_html(item):
 
     # Container (backpack storage)
     container_html = ""
-    if item["container_scu"] > 0:
-        scu_k = item["container_scu"] / 1000
+    if item.container_scu > 0:
+        scu_k = item.container_scu / 1000
         container_html = (
             f'<div class="stat-section">'
             f'<div class="stat-title">Storage</div>'
@@ -454,7 +734,7 @@ def item_to_html(item):
         stats_body = '<div class="no-stats">No detailed stats found</div>'
 
     return f"""
-<div class="item-card" data-slot="{slot}" data-tier="{item['tier']}" data-name="{name.lower()}">
+<div class="item-card" data-slot="{slot}" data-tier="{item.tier}" data-name="{item.name_lower}">
   <div class="card-header">
     <div class="card-title-row">
       <span class="item-name">{name}</span>
@@ -468,125 +748,172 @@ def item_to_html(item):
 </div>"""
 
 
+# Page stylesheet and script — static, so plain strings (no f-string escaping)
+_CSS = """
+  :root {
+    --bg:     #0d0f14;
+    --card:   #161922;
+    --border: #2a2f3d;
+    --text:   #e8ecf0;
+    --muted:  #8892a4;
+    --accent: #5b9cf6;
+    --green:  #27ae60;
+    --orange: #e67e22;
+    --red:    #c0392b;
+    --blue:   #3498db;
+  }
+  * { box-sizing:border-box; margin:0; padding:0; }
+  body { background:var(--bg); color:var(--text); font:14px/1.5 "Inter","Segoe UI",sans-serif; }
+  h1 { font-size:1.6rem; font-weight:700; letter-spacing:-.02em; }
+  header { padding:20px 24px 12px; border-bottom:1px solid var(--border); }
+  header .sub { color:var(--muted); font-size:.85rem; margin-top:4px; }
+  .controls { display:flex; flex-direction:column; gap:0; border-bottom:1px solid var(--border); }
+  .filter-row { display:flex; flex-wrap:wrap; align-items:center; gap:8px;
+                 padding:10px 24px; border-bottom:1px solid var(--border); }
+  .filter-row:last-child { border-bottom:none; }
+  .filter-label { font-size:.7rem; font-weight:700; letter-spacing:.06em; text-transform:uppercase;
+                   color:var(--muted); min-width:40px; }
+  .tabs { display:flex; flex-wrap:wrap; gap:6px; flex:1; }
+  .tab { background:var(--card); border:1px solid var(--border); border-radius:6px;
+          color:var(--muted); cursor:pointer; font-size:.8rem; padding:5px 12px;
+          transition:all .15s; }
+  .tab:hover { border-color:var(--accent); color:var(--text); }
+  .tab.active { background:var(--accent); border-color:var(--accent); color:#fff; font-weight:600; }
+  .tier-tab.active { background:var(--tier-color,var(--accent));
+                      border-color:var(--tier-color,var(--accent)); }
+  .tc { opacity:.7; font-weight:400; }
+  #search-box { background:var(--card); border:1px solid var(--border); border-radius:6px;
+                 color:var(--text); font-size:.85rem; padding:6px 12px; width:220px; }
+  #search-box:focus { outline:none; border-color:var(--accent); }
+  #vis-count { color:var(--muted); font-size:.8rem; white-space:nowrap; }
+  .grid { display:grid; grid-template-columns:repeat(auto-fill,minmax(310px,1fr));
+           gap:14px; padding:18px 24px; }
+  .item-card { background:var(--card); border:1px solid var(--border); border-radius:10px;
+                overflow:hidden; transition:border-color .15s; }
+  .item-card:hover { border-color:var(--accent); }
+  .card-header { padding:12px 14px 10px; border-bottom:1px solid var(--border); }
+  .card-title-row { display:flex; align-items:flex-start; gap:6px; flex-wrap:wrap; margin-bottom:4px; }
+  .item-name { font-weight:600; font-size:.9rem; line-height:1.3; flex:1; min-width:0;
+                overflow-wrap:break-word; }
+  .tier { font-size:.7rem; font-weight:700; border-radius:4px; padding:2px 7px;
+           color:#fff; white-space:nowrap; align-self:flex-start; }
+  .card-meta { font-size:.75rem; color:var(--muted); display:flex; flex-wrap:wrap; gap:6px;
+                align-items:center; }
+  .stat-chip { background:#1e2535; border:1px solid var(--border); border-radius:4px;
+                font-size:.7rem; padding:1px 6px; color:var(--muted); }
+  .card-body { padding:10px 14px 12px; display:flex; flex-direction:column; gap:10px; }
+  .stat-section { display:flex; flex-direction:column; gap:4px; }
+  .stat-title { font-size:.7rem; font-weight:700; letter-spacing:.06em; text-transform:uppercase;
+                  color:var(--muted); margin-bottom:2px; }
+  /* Damage bars */
+  .bar-row { display:grid; grid-template-columns:44px 1fr 38px; align-items:center; gap:6px; }
+  .bar-lbl { font-size:.72rem; color:var(--muted); text-align:right; }
+  .bar-bg { background:#1e2535; border-radius:3px; height:7px; overflow:hidden; }
+  .bar-fill { height:100%; border-radius:3px; transition:width .3s; }
+  .bar-val { font-size:.72rem; font-weight:600; color:var(--text); text-align:right; }
+  /* KV grid */
+  .kv-grid { display:grid; grid-template-columns:auto 1fr; gap:2px 10px; }
+  .k { font-size:.75rem; color:var(--muted); }
+  .v { font-size:.75rem; color:var(--text); font-weight:500; }
+  .no-stats { font-size:.78rem; color:var(--muted); font-style:italic; }
+  footer { text-align:center; padding:20px; color:var(--muted); font-size:.8rem; }"""
+
+_JS = """
+function setSlotTab(btn) {
+  document.querySelectorAll('.slot-tab').forEach(t => t.classList.remove('active'));
+  btn.classList.add('active');
+  applyFilters();
+}
+function setTierTab(btn) {
+  document.querySelectorAll('.tier-tab').forEach(t => t.classList.remove('active'));
+  btn.classList.add('active');
+  applyFilters();
+}
+function applyFilters() {
+  const slot = document.querySelector('.slot-tab.active').dataset.slot;
+  const tier = document.querySelector('.tier-tab.active').dataset.tier;
+  const q    = document.getElementById('search-box').value.toLowerCase().trim();
+  let vis = 0;
+  document.querySelectorAll('.item-card').forEach(c => {
+    const sok = slot === 'all' || c.dataset.slot === slot;
+    // tier filter: 'all' shows everything; specific tier matches exact OR items with no tier
+    const tok = tier === 'all' || c.dataset.tier === tier;
+    const nok = !q || c.dataset.name.includes(q);
+    const show = sok && tok && nok;
+    c.style.display = show ? '' : 'none';
+    if (show) vis++;
+  });
+  document.getElementById('vis-count').textContent = vis + ' shown';
+}"""
+
+
 def generate_html(items):
+    """Return the full page as one string (see write_html)."""
+    buf = io.StringIO()
+    write_html(items, buf)
+    return buf.getvalue()
+
+
+def write_html(items, fp, slot_counts=None, tier_counts=None):
+    """Write the page to fp piece by piece: head, one card at a time, tail.
+    Never holds the joined cards or the whole page as a single string.
+    slot_counts/tier_counts may be passed in if already tallied by the caller."""
     from collections import Counter
-    valid  = [i for i in items if i and i["slot"] != "Other"]
+    valid  = [i for i in items if i and i.slot != "Other"]
     count  = len(valid)
-    cards  = "\n".join(item_to_html(i) for i in valid)
 
     # Slot tabs
-    slot_counts = Counter(i["slot"] for i in valid)
-    slot_tabs = (
+    if slot_counts is None:
+        slot_counts = Counter(i.slot for i in valid)
+    slot_parts = [
         f'<button class="tab slot-tab active" data-slot="all" onclick="setSlotTab(this)">'
         f'All <span class="tc">{count}</span></button>'
-    )
+    ]
     for slot in SLOT_ORDER:
         if slot == "Other":
             continue
         c = slot_counts.get(slot, 0)
         if c:
-            slot_tabs += (
+            slot_parts.append(
                 f'<button class="tab slot-tab" data-slot="{slot}" onclick="setSlotTab(this)">'
                 f'{slot} <span class="tc">{c}</span></button>'
             )
+    slot_tabs = "".join(slot_parts)
 
     # Tier tabs
-    tier_counts = Counter(i["tier"] for i in valid if i["tier"])
+    if tier_counts is None:
+        tier_counts = Counter(i.tier for i in valid if i.tier)
     tier_total  = sum(tier_counts.values())
-    tier_tabs = (
+    tier_parts = [
         f'<button class="tab tier-tab active" data-tier="all" onclick="setTierTab(this)">'
         f'All Tiers <span class="tc">{tier_total}</span></button>'
-    )
-    for tier, label in [("light", "Light"), ("medium", "Medium"), ("heavy", "Heavy")]:
+    ]
+    for tier, label in _TIER_TABS:
         c = tier_counts.get(tier, 0)
         if c:
-            color = {"light": "#3498db", "medium": "#e67e22", "heavy": "#c0392b"}[tier]
-            tier_tabs += (
+            color = _TIER_TAB_COLORS[tier]
+            tier_parts.append(
                 f'<button class="tab tier-tab" data-tier="{tier}" '
                 f'style="--tier-color:{color}" onclick="setTierTab(this)">'
                 f'{label} <span class="tc">{c}</span></button>'
             )
+    tier_tabs = "".join(tier_parts)
 
-    return f"""<!DOCTYPE html>
+    fp.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width,initial-scale=1">
 <title>SC Armor Reference</title>
-<style>
-  :root {{
-    --bg:     #0d0f14;
-    --card:   #161922;
-    --border: #2a2f3d;
-    --text:   #e8ecf0;
-    --muted:  #8892a4;
-    --accent: #5b9cf6;
-    --green:  #27ae60;
-    --orange: #e67e22;
-    --red:    #c0392b;
-    --blue:   #3498db;
-  }}
-  * {{ box-sizing:border-box; margin:0; padding:0; }}
-  body {{ background:var(--bg); color:var(--text); font:14px/1.5 "Inter","Segoe UI",sans-serif; }}
-  h1 {{ font-size:1.6rem; font-weight:700; letter-spacing:-.02em; }}
-  header {{ padding:20px 24px 12px; border-bottom:1px solid var(--border); }}
-  header .sub {{ color:var(--muted); font-size:.85rem; margin-top:4px; }}
-  .controls {{ display:flex; flex-direction:column; gap:0; border-bottom:1px solid var(--border); }}
-  .filter-row {{ display:flex; flex-wrap:wrap; align-items:center; gap:8px;
-                 padding:10px 24px; border-bottom:1px solid var(--border); }}
-  .filter-row:last-child {{ border-bottom:none; }}
-  .filter-label {{ font-size:.7rem; font-weight:700; letter-spacing:.06em; text-transform:uppercase;
-                   color:var(--muted); min-width:40px; }}
-  .tabs {{ display:flex; flex-wrap:wrap; gap:6px; flex:1; }}
-  .tab {{ background:var(--card); border:1px solid var(--border); border-radius:6px;
-          color:var(--muted); cursor:pointer; font-size:.8rem; padding:5px 12px;
-          transition:all .15s; }}
-  .tab:hover {{ border-color:var(--accent); color:var(--text); }}
-  .tab.active {{ background:var(--accent); border-color:var(--accent); color:#fff; font-weight:600; }}
-  .tier-tab.active {{ background:var(--tier-color,var(--accent));
-                      border-color:var(--tier-color,var(--accent)); }}
-  .tc {{ opacity:.7; font-weight:400; }}
-  #search-box {{ background:var(--card); border:1px solid var(--border); border-radius:6px;
-                 color:var(--text); font-size:.85rem; padding:6px 12px; width:220px; }}
-  #search-box:focus {{ outline:none; border-color:var(--accent); }}
-  #vis-count {{ color:var(--muted); font-size:.8rem; white-space:nowrap; }}
-  .grid {{ display:grid; grid-template-columns:repeat(auto-fill,minmax(310px,1fr));
-           gap:14px; padding:18px 24px; }}
-  .item-card {{ background:var(--card); border:1px solid var(--border); border-radius:10px;
-                overflow:hidden; transition:border-color .15s; }}
-  .item-card:hover {{ border-color:var(--accent); }}
-  .card-header {{ padding:12px 14px 10px; border-bottom:1px solid var(--border); }}
-  .card-title-row {{ display:flex; align-items:flex-start; gap:6px; flex-wrap:wrap; margin-bottom:4px; }}
-  .item-name {{ font-weight:600; font-size:.9rem; line-height:1.3; flex:1; min-width:0;
-                overflow-wrap:break-word; }}
-  .tier {{ font-size:.7rem; font-weight:700; border-radius:4px; padding:2px 7px;
-           color:#fff; white-space:nowrap; align-self:flex-start; }}
-  .card-meta {{ font-size:.75rem; color:var(--muted); display:flex; flex-wrap:wrap; gap:6px;
-                align-items:center; }}
-  .stat-chip {{ background:#1e2535; border:1px solid var(--border); border-radius:4px;
-                font-size:.7rem; padding:1px 6px; color:var(--muted); }}
-  .card-body {{ padding:10px 14px 12px; display:flex; flex-direction:column; gap:10px; }}
-  .stat-section {{ display:flex; flex-direction:column; gap:4px; }}
-  .stat-title {{ font-size:.7rem; font-weight:700; letter-spacing:.06em; text-transform:uppercase;
-                  color:var(--muted); margin-bottom:2px; }}
-  /* Damage bars */
-  .bar-row {{ display:grid; grid-template-columns:44px 1fr 38px; align-items:center; gap:6px; }}
-  .bar-lbl {{ font-size:.72rem; color:var(--muted); text-align:right; }}
-  .bar-bg {{ background:#1e2535; border-radius:3px; height:7px; overflow:hidden; }}
-  .bar-fill {{ height:100%; border-radius:3px; transition:width .3s; }}
-  .bar-val {{ font-size:.72rem; font-weight:600; color:var(--text); text-align:right; }}
-  /* KV grid */
-  .kv-grid {{ display:grid; grid-template-columns:auto 1fr; gap:2px 10px; }}
-  .k {{ font-size:.75rem; color:var(--muted); }}
-  .v {{ font-size:.75rem; color:var(--text); font-weight:500; }}
-  .no-stats {{ font-size:.78rem; color:var(--muted); font-style:italic; }}
-  footer {{ text-align:center; padding:20px; color:var(--muted); font-size:.8rem; }}
+<style>""")
+    fp.write(_CSS)
+    fp.write(f"""
 </style>
 </head>
 <body>
 <header>
   <h1>Star Citizen — Armor Reference</h1>
-  <div class="sub">All player-usable armor &mdash; {count} items &middot; {GAME_VERSION}</div>
+  <div class="sub">All player-usable armor &mdash; {count} items &middot; {settings.GAME_VERSION}</div>
 </header>
 <div class="controls">
   <div class="filter-row">
@@ -601,46 +928,25 @@ def generate_html(items):
   </div>
 </div>
 <div class="grid" id="item-grid">
-{cards}
+""")
+    for n, item in enumerate(valid):
+        if n:
+            fp.write("\n")
+        fp.write(item_to_html(item))
+    fp.write(f"""
 </div>
 <footer>Data extracted from Star Citizen Data.p4k &mdash; For reference only</footer>
-<script>
-function setSlotTab(btn) {{
-  document.querySelectorAll('.slot-tab').forEach(t => t.classList.remove('active'));
-  btn.classList.add('active');
-  applyFilters();
-}}
-function setTierTab(btn) {{
-  document.querySelectorAll('.tier-tab').forEach(t => t.classList.remove('active'));
-  btn.classList.add('active');
-  applyFilters();
-}}
-function applyFilters() {{
-  const slot = document.querySelector('.slot-tab.active').dataset.slot;
-  const tier = document.querySelector('.tier-tab.active').dataset.tier;
-  const q    = document.getElementById('search-box').value.toLowerCase().trim();
-  let vis = 0;
-  document.querySelectorAll('.item-card').forEach(c => {{
-    const sok = slot === 'all' || c.dataset.slot === slot;
-    // tier filter: 'all' shows everything; specific tier matches exact OR items with no tier
-    const tok = tier === 'all' || c.dataset.tier === tier;
-    const nok = !q || c.dataset.name.includes(q);
-    const show = sok && tok && nok;
-    c.style.display = show ? '' : 'none';
-    if (show) vis++;
-  }});
-  document.getElementById('vis-count').textContent = vis + ' shown';
-}}
+<script>""")
+    fp.write(_JS)
+    fp.write("""
 </script>
 </body>
-</html>"""
+</html>""")
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────
 
 def run():
-    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-
     print("Building indexes...")
     uuid_idx = build_uuid_index()
     mfr_idx  = build_manufacturer_index(uuid_idx)
@@ -652,26 +958,60 @@ def run():
     armor_paths = scan_all_armor()
     print(f"\nParsing {len(armor_paths)} armor items...")
 
+    # Reuse parses of files unchanged since the last run; only misses are parsed
+    cache_key = _cache_key()
+    cache   = _load_cache(cache_key)
+    entries = {}
+    parsed  = [None] * len(armor_paths)
+    todo    = []
+    for n, path in enumerate(armor_paths):
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            continue
+        sig = (st.st_mtime_ns, st.st_size)
+        hit = cache.get(key)
+        if hit and hit[0] == sig:
+            parsed[n] = hit[1]
+            entries[key] = hit
+        else:
+            todo.append((n, key, sig))
+    if len(todo) < len(armor_paths):
+        print(f"  {len(armor_paths) - len(todo)} unchanged (cached), {len(todo)} to parse")
+
+    if todo:
+        results = _parse_all([armor_paths[n] for n, _, _ in todo],
+                             (uuid_idx, mfr_idx, loc_idx, dmg_idx))
+        for i, ((n, key, sig), item) in enumerate(zip(todo, results), 1):
+            if i % 200 == 0:
+                print(f"  {i}/{len(todo)}...", flush=True)
+            parsed[n] = item
+            entries[key] = (sig, item)
+    _save_cache(entries, cache_key)
+
+    # One pass: tally slot/tier tab counts while collecting the items, then
+    # one sort by slot order then name
+    slot_rank   = {s: i for i, s in enumerate(SLOT_ORDER)}
+    slot_counts = defaultdict(int)
+    tier_counts = defaultdict(int)
     items = []
     skipped = 0
-    for i, path in enumerate(armor_paths, 1):
-        if i % 200 == 0:
-            print(f"  {i}/{len(armor_paths)}...", flush=True)
-        item = parse_armor_item(path, uuid_idx, mfr_idx, loc_idx, dmg_idx)
-        if item and item["slot"] != "Other":
+    for item in parsed:
+        if item and item.slot != "Other":
             items.append(item)
+            slot_counts[item.slot] += 1
+            if item.tier:
+                tier_counts[item.tier] += 1
         else:
             skipped += 1
-
-    # Sort by slot order then name
-    slot_rank = {s: i for i, s in enumerate(SLOT_ORDER)}
-    items.sort(key=lambda x: (slot_rank.get(x["slot"], 99), x["name"].lower()))
+    items.sort(key=lambda x: (slot_rank.get(x.slot, 99), x.name.lower()))
 
     print(f"  {len(items)} items rendered, {skipped} skipped (Other/untyped)")
 
     out_path = REPORTS_DIR / "armor_preview.html"
-    html = generate_html(items)
-    out_path.write_text(html, encoding="utf-8")
+    with open(out_path, "w", encoding="utf-8") as fp:
+        write_html(items, fp, slot_counts, tier_counts)
     print(f"\nWrote {out_path}")
     print(f"  File size: {out_path.stat().st_size / 1024:.0f} KB")
 
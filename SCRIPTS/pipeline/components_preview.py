@@ -10,7 +10,8 @@ from xml.etree import ElementTree as ET
 from collections import defaultdict
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from config.settings import OUTPUT_DIR, REPORTS_DIR, GAME_VERSION
+from config import settings   # settings.GAME_VERSION: read on use, not at import
+from config.settings import OUTPUT_DIR, REPORTS_DIR
 
 # Reuse index builders + helpers from ships_preview
 from pipeline.ships_preview import (
@@ -366,7 +367,7 @@ code.cls-qtc      {{ color:#bc8cff; }}
 </head>
 <body>
 <h1>&#x1F4E6; SC DataPack — Component Reference</h1>
-<p class="subtitle">{total:,} equippable components extracted from game data — all sizes &amp; grades &mdash; {GAME_VERSION}</p>
+<p class="subtitle">{total:,} equippable components extracted from game data — all sizes &amp; grades &mdash; {settings.GAME_VERSION}</p>
 
 <div class="search-bar">
   <input id="search" type="text" placeholder="Search name, class, manufacturer..." oninput="filterRows(this.value)">
@@ -444,7 +445,6 @@ function sortTable(tblId, col) {{
 
 
 def run():
-    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
     print("Building indexes...")
     uuid_idx = build_uuid_index()
     cls_idx  = build_classname_index()
@@ -19,14 +19,21 @@ Two data sources are used:
 
 Skips extraction if Data_Extraction/.version already matches current version.
 """
+import gc
+import importlib.util
+import os
 import re
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config.settings import P4K_PATH, OUTPUT_DIR, LOGS_DIR, GAME_VERSION
+from config.settings import (P4K_PATH, P4K_DIR, OUTPUT_DIR, LOGS_DIR_STR, GAME_VERSION,
+                             DUMP_WORKERS)
 
 # ── XML sanitization ──────────────────────────────────────────────────────────
 # DataCore XML dump contains several constructs that xml.etree.ElementTree rejects:
@@ -35,16 +42,27 @@ from config.settings import P4K_PATH, OUTPUT_DIR, LOGS_DIR, GAME_VERSION
 #   2. Self-closing empty element:  < />
 #   3. Open/close element with empty name:  <>text</>
 # Strip all three so the output files parse cleanly with standard ElementTree.
-_INVALID_ATTR = re.compile(r'\s+(?:[0-9][^\s=]*)?\s*=\s*"[^"]*"')
-_EMPTY_ELEM   = re.compile(r"[ \t]*< +/>[ \t]*\n?")
-_EMPTY_TAG    = re.compile(r"[ \t]*<>[^<]*</>[ \t]*\n?")
+# Patterns are pure ASCII, so they run on the UTF-8 bytes that get written out.
+_INVALID_ATTR = re.compile(rb'\s+(?:[0-9][^\s=]*)?\s*=\s*"[^"]*"')
+_EMPTY_ELEM   = re.compile(rb"[ \t]*< +/>[ \t]*\n?")
+_EMPTY_TAG    = re.compile(rb"[ \t]*<>[^<]*</>[ \t]*\n?")
 
 
-def _sanitize_xml(xml_str: str) -> str:
-    xml_str = _INVALID_ATTR.sub("", xml_str)
-    xml_str = _EMPTY_ELEM.sub("", xml_str)
-    xml_str = _EMPTY_TAG.sub("", xml_str)
-    return xml_str
+# Bound once: the sanitizer runs per record, ~24k times per dump
+_strip_invalid_attrs = _INVALID_ATTR.sub
+_strip_empty_elems   = _EMPTY_ELEM.sub
+_strip_empty_tags    = _EMPTY_TAG.sub
+
+
+def _sanitize_xml(xml: bytes) -> bytes:
+    xml = _strip_invalid_attrs(b"", xml)
+    # Each empty-name pattern needs a literal "< " / "<>" to match — a C-level
+    # substring check skips the regex pass entirely for records without one
+    if b"< " in xml:
+        xml = _strip_empty_elems(b"", xml)
+    if b"<>" in xml:
+        xml = _strip_empty_tags(b"", xml)
+    return xml
 
 # DataCore record prefixes to dump (DataCore internal paths, lowercase, no "Data/" prefix)
 RECORD_PREFIXES = [
@@ -59,6 +77,7 @@ RECORD_PREFIXES = [
     "libs/foundry/records/commoditytypedatabase/",
     "libs/foundry/records/resourcetypedatabase/",
 ]
+_RECORD_PREFIXES = tuple(RECORD_PREFIXES)   # str.startswith takes a tuple in one call
 
 
 def _detect_version():
@@ -70,7 +89,7 @@ def _detect_version():
       2. Data.p4k file size + mtime — unique per patch even without a manifest
          (covers the case where only Data.p4k was copied to the repo root)
     """
-    manifest = P4K_PATH.parent / "build_manifest.id"
+    manifest = P4K_DIR / "build_manifest.id"
     if manifest.exists():
         version = manifest.read_text(encoding="utf-8").strip()
         if version:
@@ -80,91 +99,278 @@ def _detect_version():
         stat = P4K_PATH.stat()
         return f"p4k-{stat.st_size}-{int(stat.st_mtime)}"
     except Exception:
-        return P4K_PATH.parent.name
+        return P4K_DIR.name
 
 
 def _ensure_scdatatools():
-    """Verify scdatatools is available (installed by runner.py venv bootstrap)."""
-    try:
-        import scdatatools  # noqa: F401
+    """Verify scdatatools is available (installed by runner.py venv bootstrap).
+    find_spec only locates the package — nothing is imported until it's used."""
+    if importlib.util.find_spec("scdatatools") is not None:
         return True
-    except ImportError:
-        print("ERROR: scdatatools not found.")
-        print("Run 'python runner.py' to set up the environment automatically,")
-        print("or activate the Tools/venv/ virtual environment first.")
-        sys.exit(1)
+    print("ERROR: scdatatools not found.")
+    print("Run 'python runner.py' to set up the environment automatically,")
+    print("or activate the Tools/venv/ virtual environment first.")
+    sys.exit(1)
+
+
+_LOC_PREFIX = "Data/Localization/"   # .../<language>/global.ini
 
 
 def _extract_localization(sc, error_log):
-    """Extract global.ini files directly from P4K."""
-    ini_files = [f for f in sc.p4k.filelist if "global.ini" in f.filename]
+    """Extract global.ini files directly from P4K. error_log is an open handle."""
+    ini_files = [
+        f for f in sc.p4k.filelist
+        if f.filename.endswith("/global.ini") and f.filename.startswith(_LOC_PREFIX)
+    ]
     print(f"Extracting {len(ini_files)} global.ini files...")
     sys.stdout.flush()
 
+    # Decompress + write on a few threads. The P4K is a zipfile.ZipFile, whose
+    # shared file handle serializes the seeks/reads under its own lock, so
+    # one sc.p4k can serve every thread.
+    # Parent dirs are created up front so threads never race in makedirs.
     errors = 0
-    for info in ini_files:
-        try:
-            sc.p4k._extract_member(info, OUTPUT_DIR)
-        except Exception as e:
-            errors += 1
-            with open(str(error_log), "a", encoding="utf-8") as f:
-                f.write(f"ERROR: {info.filename}: {e}\n")
+    for d in {os.path.dirname(info.filename) for info in ini_files}:
+        os.makedirs(OUTPUT_DIR / d, exist_ok=True)
+    extract = sc.p4k._extract_member
+    with ThreadPoolExecutor(max_workers=min(8, len(ini_files) or 1)) as pool:
+        futures = {pool.submit(extract, info, OUTPUT_DIR): info for info in ini_files}
+        for fut in as_completed(futures):
+            try:
+                fut.result()
+            except Exception as e:
+                errors += 1
+                error_log.write(f"ERROR: {futures[fut].filename}: {e}\n")
 
     return len(ini_files), errors
 
 
+# ── Parallel dump ─────────────────────────────────────────────────────────────
+# DataCore objects can't be pickled, so each worker process opens the P4K and
+# loads Game2.dcb itself once (pool initializer), then is handed indices into
+# dc.records. That load costs ~75s and a few GB of RAM per worker, so the pool
+# is opt-in (SC_DUMP_WORKERS, see config.settings); the default of 1 keeps
+# everything in the main process.
+
+_WORKER_DUMP    = None   # worker's dc.dump_record_xml, bound once
+_WORKER_RECORDS = None   # worker's dc.records
+
+
+# Raw fd writes: one open/write/close per record with no TextIOWrapper or
+# newline translation (files are written with \n line endings on every OS)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+# Output dirs already created by this process — records share a few hundred
+# parent dirs, so mkdir runs once per dir instead of once per record
+_MADE_DIRS = set()
+
+
+def _write_file(path, data):
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _unchanged(path, data):
+    """True if path already holds exactly data. Most records are identical
+    between patches, so their write can be skipped. The size check rejects
+    most changed files with one stat; equal sizes still get a full compare,
+    since a value edit like "100" -> "200" keeps the length and a size-only
+    check would leave the stale file in place."""
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def _needed_indices(records):
+    """Indices into dc.records of the records the pipeline scripts need."""
+    return [
+        i for i, r in enumerate(records)
+        if r.filename.lower().startswith(_RECORD_PREFIXES)
+    ]
+
+
+def _scan_needed(p4k_dir):
+    """Load a throwaway DataCore just to list the needed record indices.
+
+    Used before starting the worker pool: the parent only needs the indices,
+    and dropping its DataCore here means it doesn't hold a copy of Game2.dcb
+    alongside every worker's for the whole dump.
+    Returns (total record count, needed indices).
+    """
+    from scdatatools.sc import StarCitizen
+    records = StarCitizen(p4k_dir).datacore.records
+    return len(records), _needed_indices(records)
+
+
+def _init_dump_worker(p4k_dir):
+    global _WORKER_DUMP, _WORKER_RECORDS
+    from scdatatools.sc import StarCitizen
+    dc = StarCitizen(p4k_dir).datacore
+    _WORKER_DUMP    = dc.dump_record_xml
+    _WORKER_RECORDS = dc.records
+
+
+def _render_one(dump, record):
+    """Dump (dc.dump_record_xml) + sanitize one record.
+    Returns (output path, UTF-8 bytes)."""
+    data = _sanitize_xml(dump(record).encode("utf-8"))
+    # record.filename: "libs/foundry/records/entities/spaceships/aegs_gladius.xml"
+    # Strip "libs/" -> "foundry/records/..."
+    # Output: OUTPUT_DIR / "Data" / "Libs" / "foundry" / "records" / ...
+    rel = record.filename[len("libs/"):]
+    return OUTPUT_DIR / "Data" / "Libs" / rel, data
+
+
+def _store(filename, out, data):
+    """Write one rendered record. Returns an error log line, or None."""
+    try:
+        parent = out.parent
+        if parent not in _MADE_DIRS:
+            parent.mkdir(parents=True, exist_ok=True)
+            _MADE_DIRS.add(parent)
+        if not _unchanged(out, data):
+            _write_file(out, data)
+        return None
+    except Exception as e:
+        return f"ERROR: {filename}: {e}\n"
+
+
+def _dump_one(dump, record):
+    """Dump one record to its XML file. Returns an error log line, or None."""
+    try:
+        out, data = _render_one(dump, record)
+    except Exception as e:
+        return f"ERROR: {record.filename}: {e}\n"
+    return _store(record.filename, out, data)
+
+
+def _dump_serial(dc, records, needed):
+    """
+    Single-process dump: yield an error log line or None per record, in order.
+
+    Rendering stays on this thread (one DataCore); file writes go to a small
+    thread pool so they overlap with rendering the next records. At most
+    256 rendered records wait for their write at any time.
+    """
+    slots = threading.Semaphore(256)
+    pending = deque()
+    # Per-record callables bound to locals once, outside the loop
+    dump    = dc.dump_record_xml
+    render  = _render_one
+    acquire = slots.acquire
+    append  = pending.append
+
+    def release(_fut):
+        slots.release()
+
+    with ThreadPoolExecutor(max_workers=4) as writers:
+        submit = writers.submit
+        for i in needed:
+            record = records[i]
+            try:
+                out, data = render(dump, record)
+            except Exception as e:
+                yield f"ERROR: {record.filename}: {e}\n"
+                continue
+            acquire()
+            fut = submit(_store, record.filename, out, data)
+            fut.add_done_callback(release)
+            append(fut)
+            while pending and pending[0].done():
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _dump_index(i):
+    return _dump_one(_WORKER_DUMP, _WORKER_RECORDS[i])
+
+
+PROGRESS_SECS = 5.0
+
+
+def _print_progress(i, total, start):
+    elapsed = time.time() - start
+    rate = i / elapsed if elapsed > 0 else 0
+    eta = (total - i) / rate if rate > 0 else 0
+    print(f"  {i:,}/{total:,}  ({rate:.0f}/s, ETA {eta/60:.1f}m)")
+    sys.stdout.flush()
+
+
 def _dump_datacore_records(sc, error_log):
-    """Parse Game2.dcb from P4K and dump needed records to disk as plain XML."""
+    """Parse Game2.dcb from P4K and dump needed records to disk as plain XML.
+    error_log is an open handle."""
     print("Loading DataCore (Game2.dcb) ... (~75s)")
     sys.stdout.flush()
     t = time.time()
-    dc = sc.datacore
-    print(f"DataCore loaded in {time.time() - t:.0f}s: {len(dc.records):,} records total")
+    # Filter to only records the pipeline scripts need (by index into dc.records,
+    # which is what the worker processes are sent)
+    use_pool = DUMP_WORKERS > 1
+    if use_pool:
+        n_records, needed = _scan_needed(P4K_DIR)
+        gc.collect()
+    else:
+        dc = sc.datacore
+        records = dc.records
+        n_records, needed = len(records), _needed_indices(records)
+    print(f"DataCore loaded in {time.time() - t:.0f}s: {n_records:,} records total")
     sys.stdout.flush()
 
-    # Filter to only records the pipeline scripts need
-    needed = [
-        r for r in dc.records
-        if any(r.filename.lower().startswith(p) for p in RECORD_PREFIXES)
-    ]
     total = len(needed)
-    print(f"Records to dump : {total:,} (~10-15 min)")
+    workers = min(DUMP_WORKERS, max(total, 1))
+    print(f"Records to dump : {total:,} (~10-15 min, {workers} worker(s))")
     sys.stdout.flush()
 
     start = time.time()
     errors = 0
 
-    for i, record in enumerate(needed, 1):
-        try:
-            xml = _sanitize_xml(dc.dump_record_xml(record))
-            # record.filename: "libs/foundry/records/entities/spaceships/aegs_gladius.xml"
-            # Strip "libs/" -> "foundry/records/..."
-            # Output: OUTPUT_DIR / "Data" / "Libs" / "foundry" / "records" / ...
-            rel = record.filename[len("libs/"):]
-            out = OUTPUT_DIR / "Data" / "Libs" / rel
-            out.parent.mkdir(parents=True, exist_ok=True)
-            out.write_text(xml, encoding="utf-8")
-        except Exception as e:
-            errors += 1
-            with open(str(error_log), "a", encoding="utf-8") as f:
-                f.write(f"ERROR: {record.filename}: {e}\n")
-
-        if i % 2000 == 0 or i == total:
-            elapsed = time.time() - start
-            rate = i / elapsed if elapsed > 0 else 0
-            eta = (total - i) / rate if rate > 0 else 0
-            print(f"  {i:,}/{total:,}  ({rate:.0f}/s, ETA {eta/60:.1f}m)")
-            sys.stdout.flush()
+    pool = None
+    if use_pool:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_dump_worker,
+                                   initargs=(P4K_DIR,))
+        results = pool.map(_dump_index, needed, chunksize=64)
+    else:
+        results = _dump_serial(dc, records, needed)
+
+    # Progress is printed every PROGRESS_SECS by a background thread reading
+    # the shared counter, so the loop itself only counts and logs errors
+    done = [0]
+    stop = threading.Event()
+
+    def report():
+        while not stop.wait(PROGRESS_SECS):
+            _print_progress(done[0], total, start)
+
+    reporter = threading.Thread(target=report, daemon=True)
+    reporter.start()
+    try:
+        for err in results:
+            done[0] += 1
+            if err:
+                errors += 1
+                error_log.write(err)
+    finally:
+        stop.set()
+        reporter.join()
+        if pool is not None:
+            pool.shutdown()
+    if total:
+        _print_progress(done[0], total, start)
 
     return total, errors, time.time() - start
 
 
 def run():
-    LOGS_DIR.mkdir(parents=True, exist_ok=True)
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-    error_log = LOGS_DIR / "extraction_errors.log"
-
     version = _detect_version()
 
     version_file = OUTPUT_DIR / ".version"
@@ -183,15 +389,22 @@ def run():
 
     print("Opening P4K index...")
     sys.stdout.flush()
-    sc = StarCitizen(P4K_PATH.parent)
+    sc = StarCitizen(P4K_DIR)
 
-    # Step 1: Localization files from P4K
-    loc_total, loc_errors = _extract_localization(sc, error_log)
-    print(f"Localization : {loc_total} files ({loc_errors} errors)")
-    sys.stdout.flush()
-
-    # Step 2: DataCore records -> individual XML files
-    rec_total, rec_errors, rec_elapsed = _dump_datacore_records(sc, error_log)
+    # One append handle for the whole run (line-buffered, so each error lands
+    # on disk as it happens) instead of reopening the log per error
+    error_log = open(os.path.join(LOGS_DIR_STR, "extraction_errors.log"), "a",
+                     encoding="utf-8", buffering=1)
+    try:
+        # Step 1: Localization files from P4K
+        loc_total, loc_errors = _extract_localization(sc, error_log)
+        print(f"Localization : {loc_total} files ({loc_errors} errors)")
+        sys.stdout.flush()
+
+        # Step 2: DataCore records -> individual XML files
+        rec_total, rec_errors, rec_elapsed = _dump_datacore_records(sc, error_log)
+    finally:
+        error_log.close()
 
     version_file.write_text(version)
 
@@ -4,19 +4,41 @@ Parses ground vehicle XMLs from the DataCore extraction,
 outputs a self-contained searchable/filterable HTML page.
 """
 
+import functools
+import io
+import math
+import os
+import pickle
+import re
 import sys
+import threading
 from pathlib import Path
-from xml.etree import ElementTree as ET
 from collections import Counter
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# lxml's C parser is a drop-in for the ElementTree calls used here;
+# fall back to the stdlib when it isn't installed.
+try:
+    from lxml import etree as ET
+    # Parser options for iterparse() and the manufacturer XMLParser
+    _PARSE_KW = dict(huge_tree=True, remove_blank_text=True, collect_ids=False,
+                     remove_comments=True, remove_pis=True)
+except ImportError:
+    from xml.etree import ElementTree as ET
+    _PARSE_KW = {}
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from config.settings import OUTPUT_DIR, REPORTS_DIR, GAME_VERSION
+from config import settings   # settings.GAME_VERSION: read on use, not at import
+from config.settings import OUTPUT_DIR, REPORTS_DIR, LOGS_DIR
 
-# Reuse localization helper from ships_preview
-from pipeline.ships_preview import build_localization_index
+# Reuse localization and cache-signature helpers from ships_preview
+from pipeline.ships_preview import build_localization_index, _source_sig
 
 RECORDS_DIR = OUTPUT_DIR / "Data" / "Libs" / "foundry" / "records"
 GV_DIR      = RECORDS_DIR / "entities" / "groundvehicles"
+MFR_DIR     = RECORDS_DIR / "scitemmanufacturer"
+LOC_INI     = OUTPUT_DIR / "Data" / "Localization" / "english" / "global.ini"
 
 # ── Manufacturer display names ─────────────────────────────────────────────────
 MFR_NAMES = {
@@ -31,7 +53,14 @@ MFR_NAMES = {
 }
 
 # ── Movement class mapping ─────────────────────────────────────────────────────
-MOVEMENT_LABELS = {
+class _MovementDict(dict):
+    """Unknown classes map to their name minus "Arcade", stored on first use."""
+    def __missing__(self, key):
+        label = self[key] = key.replace("Arcade", "")
+        return label
+
+
+MOVEMENT_LABELS = _MovementDict({
     "ArcadeWheeled": "Wheeled",
     "ArcadeTracked":  "Tracked",
     "ArcadeHover":    "Hover",
@@ -39,20 +68,48 @@ MOVEMENT_LABELS = {
     "Wheeled":        "Wheeled",
     "Tracked":        "Tracked",
     "Hover":          "Hover",
-}
+})
 
 # ── Skip filter ────────────────────────────────────────────────────────────────
 _SKIP_PATTERNS = (
     "_ai_", "_unmanned_", "_indestructible", "nocrimesagainst",
     "_pu_ai_", "_ea_", "_raceannouncer", "_prison",
 )
+# All skip substrings as one alternation — a single C-level scan per name
+_SKIP_RE = re.compile("|".join(map(re.escape, _SKIP_PATTERNS)))
 
 def _should_skip(stem):
-    s = stem.lower()
-    return any(p in s for p in _SKIP_PATTERNS)
+    return _SKIP_RE.search(stem.lower()) is not None
 
 
 # ── Lightweight manufacturer index ────────────────────────────────────────────
+_TLS = threading.local()
+
+def _mfr_parser():
+    """Per-thread parser for manufacturer records (lxml parsers aren't
+    thread-safe). Only two root attributes are needed, so tolerate bad XML."""
+    if not _PARSE_KW:   # stdlib ElementTree: default parser
+        return None
+    parser = getattr(_TLS, "parser", None)
+    if parser is None:
+        parser = _TLS.parser = ET.XMLParser(recover=True, **_PARSE_KW)
+    return parser
+
+
+def _read_mfr(xml_file):
+    """(uuid, code) for one scitemmanufacturer XML, or None."""
+    try:
+        root = ET.parse(str(xml_file), _mfr_parser()).getroot()
+        # DataCore dump uses __id; old extraction uses __ref
+        uid = root.get("__id") or root.get("__ref")
+        code = root.get("Code") or root.get("code") or xml_file.stem.upper()
+        if uid:
+            return uid, code
+    except Exception:
+        pass
+    return None
+
+
 def build_mfr_index():
     """Build {uuid -> manufacturer_code} from scitemmanufacturer XMLs."""
     index = {}
@@ -60,32 +117,41 @@ def build_mfr_index():
     if not mfr_dir.exists():
         print("  WARNING: scitemmanufacturer dir not found")
         return index
-    for xml_file in mfr_dir.rglob("*.xml"):
-        try:
-            root = ET.parse(xml_file).getroot()
-            # DataCore dump uses __id; old extraction uses __ref
-            uid = root.get("__id") or root.get("__ref")
-            code = root.get("Code") or root.get("code") or xml_file.stem.upper()
-            if uid:
-                index[uid] = code
-        except Exception:
-            pass
+    # File opens dominate here, so threads are enough; map() keeps rglob order
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for hit in pool.map(_read_mfr, mfr_dir.rglob("*.xml")):
+            if hit:
+                index[hit[0]] = hit[1]
     print(f"  {len(index):,} manufacturer UUIDs indexed")
     return index
 
 
 # ── Localization helpers ───────────────────────────────────────────────────────
-def _resolve_loc(key_raw, loc_idx):
-    """Strip '@' prefix and look up in localization index. Returns '' on miss."""
+# The same career/role keys recur on every vehicle — memoize the lookup by
+# key against the index last passed in (cache dropped if the index changes)
+_LOC_IDX = {}
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_loc_key(key_raw):
     if not key_raw or not key_raw.startswith("@"):
         return key_raw or ""
-    key = key_raw[1:].lower()
-    val = loc_idx.get(key, "")
-    if "PLACEHOLDER" in val.upper() or "UNINITIALIZED" in val.upper():
+    # Index keys are already lowercase (build_localization_index)
+    val = _LOC_IDX.get(key_raw[1:].lower(), "")
+    upper = val.upper()
+    if "PLACEHOLDER" in upper or "UNINITIALIZED" in upper:
         return ""
     return val.replace("\\n", " ").replace("\\t", " ").strip()
 
 
+def _resolve_loc(key_raw, loc_idx):
+    """Strip '@' prefix and look up in localization index. Returns '' on miss."""
+    global _LOC_IDX
+    if loc_idx is not _LOC_IDX:
+        _LOC_IDX = loc_idx
+        _resolve_loc_key.cache_clear()
+    return _resolve_loc_key(key_raw)
+
+
 def _clean_loc_fallback(key_raw, prefix):
     """Strip '@' + known prefix, replace underscores, title-case as fallback."""
     if not key_raw:
@@ -97,14 +163,103 @@ def _clean_loc_fallback(key_raw, prefix):
 
 
 # ── Vehicle parser ─────────────────────────────────────────────────────────────
-def parse_vehicle(path, mfr_idx, loc_idx):
-    """Parse one ground vehicle XML. Returns info dict or None on error."""
+# Numeric attribute readers: plain digit strings (the common case) skip the
+# exception machinery; anything unparsable gives the default.
+def _to_int(s, default=0):
+    if s.isdecimal():
+        return int(s)
     try:
-        root = ET.parse(path).getroot()
-    except Exception as e:
-        print(f"  PARSE ERROR {path.name}: {e}")
-        return None
+        return int(s)
+    except (ValueError, TypeError):
+        return default
+
+
+def _to_whole(s, default=0):
+    """int(float(s)) — for counts the data sometimes writes as "123.0"."""
+    if s.isdecimal():
+        return int(s)
+    try:
+        return int(float(s))
+    except (ValueError, TypeError, OverflowError):
+        return default
+
+
+def _to_float(s, default=0.0):
+    try:
+        return float(s)
+    except (ValueError, TypeError):
+        return default
+
+
+def _set_bbox(info, attrib):
+    info["bbox_x"] = _to_float(attrib.get("x", ""))
+    info["bbox_y"] = _to_float(attrib.get("y", ""))
+    info["bbox_z"] = _to_float(attrib.get("z", ""))
+
+
+def _read_vehicle_params(el, info, mfr_idx, loc_idx):
+    """Fill name/career/role/specs/manufacturer from VehicleComponentParams."""
+    # One attribute mapping and one bound lookup for all the reads below
+    get = el.attrib.get
+    # Name (loc key like @vehicle_NameTMBL_Cyclone)
+    vn_raw = get("vehicleName", "")
+    info["name"] = _resolve_loc(vn_raw, loc_idx) or \
+                   _clean_loc_fallback(vn_raw, ("vehicle_name", "vehicle_Name"))
+
+    # Career / role
+    vc_raw = get("vehicleCareer", "")
+    vr_raw = get("vehicleRole", "")
+    info["career"] = _resolve_loc(vc_raw, loc_idx) or \
+                     _clean_loc_fallback(vc_raw, ("vehicle_focus_", "vehicle_career_"))
+    info["role"]   = _resolve_loc(vr_raw, loc_idx) or \
+                     _clean_loc_fallback(vr_raw, ("vehicle_class_", "vehicle_role_"))
+
+    # Crew / hull HP
+    info["crew"]    = _to_int(get("crewSize", ""))
+    info["hull_hp"] = _to_whole(get("vehicleHullDamageNormalizationValue", ""))
+
+    # Movement class
+    mv = get("movementClass", "")
+    info["movement"] = MOVEMENT_LABELS[mv]
+
+    # Manufacturer UUID
+    mfr_uuid = get("manufacturer", "")
+    if mfr_uuid and mfr_uuid != "00000000-0000-0000-0000-000000000000":
+        code = mfr_idx.get(mfr_uuid, "")
+        info["mfr_code"] = code
+        info["mfr"] = MFR_NAMES.get(code, code)
+
+
+# Loadout port names that count as weapon hardpoints
+_WEAPON_RE = re.compile(r"weapon|gun|turret|rack", re.IGNORECASE)
+
+# Vehicle files repeat a small set of tag names, so each tag's substring
+# tests run once and the result is cached: tag -> (is VCP tag, kind)
+_BBOX, _INS, _PORT = 1, 2, 3
+_TAG_KINDS = {}
+
+def _tag_kind(tag):
+    try:
+        return _TAG_KINDS[tag]
+    except KeyError:
+        if "maxBoundingBoxSize" in tag:
+            kind = _BBOX
+        elif "shipInsuranceParams" in tag:
+            kind = _INS
+        elif "SItemPortLoadoutEntryParams" in tag:
+            kind = _PORT
+        else:
+            kind = 0
+        hit = _TAG_KINDS[tag] = ("VehicleComponentParams" in tag, kind)
+        return hit
 
+
+def parse_vehicle(path, mfr_idx, loc_idx):
+    """Parse one ground vehicle XML. Returns info dict or None on error.
+
+    One streaming iterparse pass: everything is read from attributes on the
+    start event, and each element is cleared on its end event.
+    """
     info = {
         "file":     path.stem,
         "name":     "",
@@ -123,106 +278,150 @@ def parse_vehicle(path, mfr_idx, loc_idx):
         "weapons":  0,
     }
 
-    # ── VehicleComponentParams ────────────────────────────────────────────────
-    for el in root.iter():
-        pt = el.get("__polymorphicType", "")
-        if "VehicleComponentParams" not in el.tag and "VehicleComponentParams" not in pt:
-            continue
-
-        # Name (loc key like @vehicle_NameTMBL_Cyclone)
-        vn_raw = el.get("vehicleName", "")
-        info["name"] = _resolve_loc(vn_raw, loc_idx) or \
-                       _clean_loc_fallback(vn_raw, ("vehicle_name", "vehicle_Name"))
+    root_tag     = None
+    depth        = 0
+    vcp_depth    = 0      # depth of the first VehicleComponentParams, 0 = not seen
+    vcp_open     = False  # still inside it (for its direct bbox child)
+    vcp_bbox     = False  # direct bbox child already taken
+    first_bbox   = None   # attributes of the first bbox anywhere, for the fallback
+    ins_done     = False
+    weapon_count = 0
 
-        # Career / role
-        vc_raw = el.get("vehicleCareer", "")
-        vr_raw = el.get("vehicleRole", "")
-        info["career"] = _resolve_loc(vc_raw, loc_idx) or \
-                         _clean_loc_fallback(vc_raw, ("vehicle_focus_", "vehicle_career_"))
-        info["role"]   = _resolve_loc(vr_raw, loc_idx) or \
-                         _clean_loc_fallback(vr_raw, ("vehicle_class_", "vehicle_role_"))
+    try:
+        for event, el in ET.iterparse(str(path), events=("start", "end"), **_PARSE_KW):
+            if event == "end":
+                if vcp_open and depth == vcp_depth:
+                    vcp_open = False
+                depth -= 1
+                el.clear()
+                continue
+
+            depth += 1
+            tag = el.tag
+            if root_tag is None:
+                root_tag = tag
+            is_vcp, kind = _tag_kind(tag)
+
+            # ── VehicleComponentParams (first one only) ──────────────────────
+            if not vcp_depth and (is_vcp or
+                                  "VehicleComponentParams" in el.get("__polymorphicType", "")):
+                vcp_depth = depth
+                vcp_open  = True
+                _read_vehicle_params(el, info, mfr_idx, loc_idx)
+
+            if kind == _BBOX:
+                if first_bbox is None:
+                    first_bbox = dict(el.attrib)
+                # Bounding box (direct child of VehicleComponentParams)
+                if vcp_open and not vcp_bbox and depth == vcp_depth + 1:
+                    vcp_bbox = True
+                    _set_bbox(info, el.attrib)
+
+            # ── Insurance ────────────────────────────────────────────────────
+            elif kind == _INS and not ins_done:
+                ins_done = True
+                info["ins_wait"] = _to_float(el.get("baseWaitTimeMinutes", ""))
+                info["ins_fee"]  = _to_whole(el.get("baseExpeditingFee", ""))
+
+            # ── Weapon hardpoints from loadout ───────────────────────────────
+            elif kind == _PORT:
+                if _WEAPON_RE.search(el.get("itemPortName", "")):
+                    weapon_count += 1
+    except Exception as e:
+        print(f"  PARSE ERROR {path.name}: {e}")
+        return None
 
-        # Crew
-        try:
-            info["crew"] = int(el.get("crewSize", 0))
-        except (ValueError, TypeError):
-            pass
+    info["weapons"] = weapon_count
 
-        # Hull HP
-        try:
-            info["hull_hp"] = int(float(el.get("vehicleHullDamageNormalizationValue", 0)))
-        except (ValueError, TypeError):
-            pass
-
-        # Movement class
-        mv = el.get("movementClass", "")
-        info["movement"] = MOVEMENT_LABELS.get(mv, mv.replace("Arcade", "") if mv else "")
-
-        # Manufacturer UUID
-        mfr_uuid = el.get("manufacturer", "")
-        if mfr_uuid and mfr_uuid != "00000000-0000-0000-0000-000000000000":
-            code = mfr_idx.get(mfr_uuid, "")
-            info["mfr_code"] = code
-            info["mfr"] = MFR_NAMES.get(code, code)
-
-        # Bounding box (direct child of VehicleComponentParams)
-        for sub in el:
-            if "maxBoundingBoxSize" in sub.tag or sub.tag == "maxBoundingBoxSize":
-                try:
-                    info["bbox_x"] = float(sub.get("x", 0))
-                    info["bbox_y"] = float(sub.get("y", 0))
-                    info["bbox_z"] = float(sub.get("z", 0))
-                except (ValueError, TypeError):
-                    pass
-                break
-        break  # only first VehicleComponentParams
-
-    # Bounding box fallback via full iter
-    if info["bbox_x"] == 0.0 and info["bbox_y"] == 0.0:
-        for el in root.iter():
-            if el.tag == "maxBoundingBoxSize" or "maxBoundingBoxSize" in el.tag:
-                try:
-                    info["bbox_x"] = float(el.get("x", 0))
-                    info["bbox_y"] = float(el.get("y", 0))
-                    info["bbox_z"] = float(el.get("z", 0))
-                except (ValueError, TypeError):
-                    pass
-                break
+    # Bounding box fallback: first maxBoundingBoxSize anywhere in the file
+    if info["bbox_x"] == 0.0 and info["bbox_y"] == 0.0 and first_bbox is not None:
+        _set_bbox(info, first_bbox)
 
     # Name fallback from root tag: EntityClassDefinition.TMBL_Cyclone
-    if not info["name"]:
-        tag = root.tag
-        if "." in tag:
-            cls = tag.split(".", 1)[1]   # e.g. TMBL_Cyclone
-            info["name"] = cls.replace("_", " ")
-
-    # ── Insurance ─────────────────────────────────────────────────────────────
-    for el in root.iter():
-        if el.tag == "shipInsuranceParams" or "shipInsuranceParams" in el.tag:
-            try:
-                info["ins_wait"] = float(el.get("baseWaitTimeMinutes", 0))
-            except (ValueError, TypeError):
-                pass
-            try:
-                info["ins_fee"] = int(float(el.get("baseExpeditingFee", 0)))
-            except (ValueError, TypeError):
-                pass
-            break
-
-    # ── Weapon hardpoints from loadout ─────────────────────────────────────────
-    weapon_count = 0
-    for el in root.iter():
-        if el.tag != "SItemPortLoadoutEntryParams" and \
-           "SItemPortLoadoutEntryParams" not in el.tag:
-            continue
-        port = el.get("itemPortName", "").lower()
-        if any(k in port for k in ("weapon", "gun", "turret", "rack")):
-            weapon_count += 1
-    info["weapons"] = weapon_count
+    if not info["name"] and root_tag and "." in root_tag:
+        cls = root_tag.split(".", 1)[1]   # e.g. TMBL_Cyclone
+        info["name"] = cls.replace("_", " ")
 
     return info
 
 
+# ── Process pool worker ────────────────────────────────────────────────────────
+# Indexes are sent once per worker via the pool initializer instead of being
+# pickled with every task.
+_WORKER_IDX = ()
+
+def _init_worker(mfr_idx, loc_idx):
+    global _WORKER_IDX
+    _WORKER_IDX = (mfr_idx, loc_idx)
+
+
+def _parse_in_worker(path):
+    return parse_vehicle(path, *_WORKER_IDX)
+
+
+# Below this many files (the whole ~100-vehicle set, or a mostly-cached
+# rerun) starting workers and unpickling the indexes into each costs more
+# than parsing in-process
+_POOL_MIN_FILES = 200
+_CHUNKSIZE      = 16
+
+
+def _parse_all(paths, idx):
+    """Yield parse_vehicle() for each path, in order: in-process for a
+    handful of files, else on a pool with no more workers than chunks."""
+    workers = min(61, os.cpu_count() or 1,   # 61 = Windows process pool limit
+                  math.ceil(len(paths) / _CHUNKSIZE))
+    if len(paths) < _POOL_MIN_FILES or workers < 2:
+        for path in paths:
+            yield parse_vehicle(path, *idx)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=idx) as pool:
+        yield from pool.map(_parse_in_worker, paths, chunksize=_CHUNKSIZE)
+
+
+# ── Parse cache ────────────────────────────────────────────────────────────────
+# {path: ((mtime_ns, size), info)} from the previous run, valid while the game
+# version and the indexes the parse reads from are unchanged. Bump
+# _CACHE_VERSION whenever the info dict layout changes.
+
+_CACHE_FILE    = LOGS_DIR / ".gv_cache.pkl"
+_CACHE_VERSION = 1
+
+# Names, careers and roles come from global.ini; makers from
+# scitemmanufacturer + MFR_NAMES
+_CACHE_SOURCES = (LOC_INI, MFR_DIR)
+
+
+def _cache_key():
+    # One signature per source, so a missing one just reads as None
+    return (_CACHE_VERSION, settings.GAME_VERSION,
+            tuple(_source_sig([src]) for src in _CACHE_SOURCES),
+            tuple(sorted(MFR_NAMES.items())))
+
+
+def _load_cache(key):
+    try:
+        with open(_CACHE_FILE, "rb") as f:
+            data = pickle.load(f)
+        if data.get("key") == key:
+            return data["entries"]
+    except Exception:
+        pass
+    return {}
+
+
+def _save_cache(entries, key):
+    tmp = _CACHE_FILE.with_suffix(".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump({"key": key, "entries": entries},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, _CACHE_FILE)
+    except Exception:
+        pass
+
+
 # ── Scanner ────────────────────────────────────────────────────────────────────
 def scan_all_vehicles():
     if not GV_DIR.exists():
@@ -248,6 +447,7 @@ CAREER_COLORS = {
     "utility":          "#546e7a",
 }
 
+@functools.lru_cache(maxsize=256)
 def _career_color(career):
     return CAREER_COLORS.get(career.lower(), "#5b9cf6")
 
@@ -264,25 +464,38 @@ def _kv(k, v):
     return f'<span class="k">{k}</span><span class="v">{v}</span>'
 
 
-def vehicle_to_html(v):
+def _career_meta(career):
+    """(data-career key, colour) for a career name."""
+    return career.lower().replace(" ", ""), _career_color(career)
+
+
+def vehicle_to_html(v, career_meta=None):
+    """One card. career_meta {career: (key, colour)} may be passed in when
+    the caller has already built it for the tabs."""
     name   = v["name"] or v["file"]
     mfr    = v["mfr"] or v["mfr_code"] or "Unknown"
     career = v["career"]
     role   = v["role"]
 
-    career_badge = _badge(career, _career_color(career)) if career else ""
+    if career:
+        career_key, color = (career_meta[career] if career_meta is not None
+                             else _career_meta(career))
+        career_badge = _badge(career, color)
+    else:
+        career_key, career_badge = "unknown", ""
     role_text    = f" &middot; {role}" if role else ""
 
     # Specs section
-    spec_rows = ""
+    rows = []
     if v["crew"]:
-        spec_rows += _kv("Crew", str(v["crew"]))
+        rows.append(_kv("Crew", str(v["crew"])))
     if v["hull_hp"]:
-        spec_rows += _kv("Hull HP", f'{v["hull_hp"]:,}')
+        rows.append(_kv("Hull HP", f'{v["hull_hp"]:,}'))
     if v["movement"]:
-        spec_rows += _kv("Drive", v["movement"])
+        rows.append(_kv("Drive", v["movement"]))
     if v["weapons"] > 0:
-        spec_rows += _kv("Weapon ports", str(v["weapons"]))
+        rows.append(_kv("Weapon ports", str(v["weapons"])))
+    spec_rows = "".join(rows)
     specs_html = (
         f'<div class="stat-section">'
         f'<div class="stat-title">Specifications</div>'
@@ -306,11 +519,12 @@ def vehicle_to_html(v):
         )
 
     # Insurance section
-    ins_rows = ""
+    rows = []
     if v["ins_wait"]:
-        ins_rows += _kv("Wait", f'{v["ins_wait"]:.1f} min')
+        rows.append(_kv("Wait", f'{v["ins_wait"]:.1f} min'))
     if v["ins_fee"]:
-        ins_rows += _kv("Expedite", f'{v["ins_fee"]:,} aUEC')
+        rows.append(_kv("Expedite", f'{v["ins_fee"]:,} aUEC'))
+    ins_rows = "".join(rows)
     ins_html = (
         f'<div class="stat-section">'
         f'<div class="stat-title">Insurance</div>'
@@ -321,8 +535,7 @@ def vehicle_to_html(v):
     if not body:
         body = '<div class="no-stats">No stats found</div>'
 
-    mfr_key    = v["mfr_code"].lower() if v["mfr_code"] else "unknown"
-    career_key = career.lower().replace(" ", "") if career else "unknown"
+    mfr_key = v["mfr_code"].lower() if v["mfr_code"] else "unknown"
 
     return (
         f'<div class="item-card" '
@@ -339,40 +552,62 @@ def vehicle_to_html(v):
 
 # ── HTML page ──────────────────────────────────────────────────────────────────
 def generate_html(vehicles):
-    valid  = [v for v in vehicles if v]
-    count  = len(valid)
-    cards  = "\n".join(vehicle_to_html(v) for v in valid)
+    """Return the full page as one string (see write_html)."""
+    buf = io.StringIO()
+    write_html(vehicles, buf)
+    return buf.getvalue()
+
+
+def write_html(vehicles, fp):
+    """Write the page to fp piece by piece: head, one card at a time, tail.
+    Never holds the joined cards or the whole page as a single string."""
+    # One pass: tab counts and the data-mfr code of each maker's first
+    # vehicle (the tab filter key)
+    valid         = []
+    mfr_counts    = Counter()
+    career_counts = Counter()
+    mfr_to_code   = {}
+    for v in vehicles:
+        if not v:
+            continue
+        valid.append(v)
+        mfr = v["mfr"] or "Unknown"
+        mfr_counts[mfr] += 1
+        mfr_to_code.setdefault(mfr, (v["mfr_code"] or "unknown").lower())
+        if v["career"]:
+            career_counts[v["career"]] += 1
+    count = len(valid)
 
     # Manufacturer tabs
-    mfr_counts = Counter(v["mfr"] or "Unknown" for v in valid)
-    mfr_tabs = (
+    tabs = [
         f'<button class="tab mfr-tab active" data-mfr="all" onclick="setMfrTab(this)">'
         f'All <span class="tc">{count}</span></button>\n'
-    )
+    ]
     for mfr, c in sorted(mfr_counts.items()):
-        code = next((v["mfr_code"].lower() for v in valid
-                     if (v["mfr"] or "Unknown") == mfr), "unknown")
-        mfr_tabs += (
+        code = mfr_to_code.get(mfr, "unknown")
+        tabs.append(
             f'<button class="tab mfr-tab" data-mfr="{code}" onclick="setMfrTab(this)">'
             f'{mfr} <span class="tc">{c}</span></button>\n'
         )
+    mfr_tabs = "".join(tabs)
 
     # Career tabs
-    career_counts = Counter(v["career"] for v in valid if v["career"])
-    career_tabs = (
+    tabs = [
         f'<button class="tab career-tab active" data-career="all" onclick="setCareerTab(this)">'
         f'All Careers <span class="tc">{count}</span></button>\n'
-    )
+    ]
+    # Each career's key and colour, shared by its tab and its cards
+    career_meta = {career: _career_meta(career) for career in career_counts}
     for career, c in sorted(career_counts.items()):
-        ckey  = career.lower().replace(" ", "")
-        color = _career_color(career)
-        career_tabs += (
+        ckey, color = career_meta[career]
+        tabs.append(
             f'<button class="tab career-tab" data-career="{ckey}" '
             f'style="--cc:{color}" onclick="setCareerTab(this)">'
             f'{career} <span class="tc">{c}</span></button>\n'
         )
+    career_tabs = "".join(tabs)
 
-    return f"""<!DOCTYPE html>
+    fp.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -435,7 +670,7 @@ def generate_html(vehicles):
 <body>
 <header>
   <h1>Ground Vehicles</h1>
-  <div class="sub">Star Citizen &mdash; {count} vehicles &middot; {GAME_VERSION}</div>
+  <div class="sub">Star Citizen &mdash; {count} vehicles &middot; {settings.GAME_VERSION}</div>
 </header>
 <div class="controls">
   <div class="filter-row">
@@ -453,7 +688,12 @@ def generate_html(vehicles):
   </div>
 </div>
 <div class="grid" id="grid">
-{cards}
+""")
+    for n, v in enumerate(valid):
+        if n:
+            fp.write("\n")
+        fp.write(vehicle_to_html(v, career_meta))
+    fp.write(f"""
 </div>
 <script>
 var allCards = Array.from(document.querySelectorAll('.item-card'));
@@ -490,13 +730,11 @@ function applyFilters() {{
 applyFilters();
 </script>
 </body>
-</html>"""
+</html>""")
 
 
 # ── Entry point ────────────────────────────────────────────────────────────────
 def run():
-    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-
     print("Ground Vehicles: loading indexes...")
     sys.stdout.flush()
     loc_idx = build_localization_index()
@@ -510,22 +748,46 @@ def run():
         print("  ERROR: no ground vehicle XMLs found. Run extractor.py first.")
         sys.exit(1)
 
-    vehicles = []
-    for path in paths:
-        v = parse_vehicle(path, mfr_idx, loc_idx)
-        if v:
-            vehicles.append(v)
-
-    vehicles.sort(key=lambda v: (v["mfr"], v["name"]))
+    # Reuse parses of files unchanged since the last run; only misses are parsed
+    cache_key = _cache_key()
+    cache   = _load_cache(cache_key)
+    entries = {}
+    parsed  = [None] * len(paths)
+    todo    = []
+    for n, path in enumerate(paths):
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            continue
+        sig = (st.st_mtime_ns, st.st_size)
+        hit = cache.get(key)
+        if hit and hit[0] == sig:
+            parsed[n] = hit[1]
+            entries[key] = hit
+        else:
+            todo.append((n, key, sig))
+    if len(todo) < len(paths):
+        print(f"  {len(paths) - len(todo)} unchanged (cached), {len(todo)} to parse")
+
+    if todo:
+        results = _parse_all([paths[n] for n, _, _ in todo], (mfr_idx, loc_idx))
+        for (n, key, sig), v in zip(todo, results):
+            parsed[n] = v
+            entries[key] = (sig, v)
+    _save_cache(entries, cache_key)
+
+    vehicles = [v for v in parsed if v]
+
+    vehicles.sort(key=itemgetter("mfr", "name"))
 
     print(f"  Parsed: {len(vehicles)} vehicles")
     sys.stdout.flush()
 
-    out  = REPORTS_DIR / "groundvehicles.html"
-    html = generate_html(vehicles)
-    out.write_text(html, encoding="utf-8")
-    sz   = len(html)
-    print(f"  Written: {out.name} ({sz:,} bytes)")
+    out = REPORTS_DIR / "groundvehicles.html"
+    with open(out, "w", encoding="utf-8", buffering=1 << 16) as fp:
+        write_html(vehicles, fp)
+    print(f"  Written: {out.name} ({out.stat().st_size:,} bytes)")
     sys.stdout.flush()
 
 
@@ -10,32 +10,49 @@ Covers player-usable items NOT handled by other reports:
 Outputs a self-contained searchable/filterable HTML page.
 """
 
+import functools
+import io
+import math
+import os
+import pickle
+import re
 import sys
 from pathlib import Path
-from xml.etree import ElementTree as ET
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# lxml's C parser is a drop-in for the ElementTree calls used here;
+# fall back to the stdlib when it isn't installed.
+try:
+    from lxml import etree as ET
+    _PARSE_KW = dict(remove_blank_text=True, remove_comments=True, remove_pis=True)
+except ImportError:
+    from xml.etree import ElementTree as ET
+    _PARSE_KW = {}
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from config.settings import OUTPUT_DIR, REPORTS_DIR, GAME_VERSION
+from config import settings   # settings.GAME_VERSION: read on use, not at import
+from config.settings import OUTPUT_DIR, REPORTS_DIR, LOGS_DIR
 
-from pipeline.ships_preview import build_localization_index
+from pipeline.ships_preview import build_localization_index, _source_sig
 from pipeline.groundvehicles_preview import build_mfr_index
 
 RECORDS_DIR = OUTPUT_DIR / "Data" / "Libs" / "foundry" / "records"
 SCITEM_DIR  = RECORDS_DIR / "entities" / "scitem"
+LOC_INI     = OUTPUT_DIR / "Data" / "Localization" / "english" / "global.ini"
 
 # ── Source paths and their category labels ────────────────────────────────────
+# carryables: keep consumable/tool types, skip pure furniture
+_CARRY_FILTER = frozenset({"FPS_Consumable", "Drink", "Food", "Gadget", "Misc"})
+
 SOURCES = [
     # (path,                                   category,     include_types filter or None=all)
     (SCITEM_DIR / "consumables",               "Consumable", None),
     (SCITEM_DIR / "fps_devices",               "Deployable", None),
     (SCITEM_DIR / "weapons" / "melee",         "Melee",      None),
     (SCITEM_DIR / "weapons" / "throwable",     "Throwable",  None),
-    # carryables/1h: filter for consumable/tool types, skip pure furniture
-    (SCITEM_DIR / "carryables" / "1h",         "Consumable", {"FPS_Consumable", "Drink", "Food",
-                                                               "Gadget", "Misc"}),
-    (SCITEM_DIR / "carryables" / "2h",         "Consumable", {"FPS_Consumable", "Drink", "Food",
-                                                               "Gadget", "Misc"}),
+    (SCITEM_DIR / "carryables" / "1h",         "Consumable", _CARRY_FILTER),
+    (SCITEM_DIR / "carryables" / "2h",         "Consumable", _CARRY_FILTER),
 ]
 
 # ── Manufacturer display names (same as other scripts) ───────────────────────
@@ -59,14 +76,12 @@ _SKIP_PATTERNS = (
     "_template", "_nodraw", "_dummy", "_test", "_debug",
     "_npc_", "_ai_", "_s42_",
 )
+# All skip substrings as one alternation — a single C-level scan per name
+_SKIP_RE = re.compile("|".join(map(re.escape, _SKIP_PATTERNS)))
 
-def _should_skip(stem, loc_name):
-    s = stem.lower()
-    if any(p in s for p in _SKIP_PATTERNS):
-        return True
-    if not loc_name:
-        return True   # no resolved name = dev/placeholder item
-    return False
+def _should_skip(stem):
+    """Dev/template variants, decided from the file name alone (no parse)."""
+    return _SKIP_RE.search(stem.lower()) is not None
 
 
 # ── Type → display category mapping ──────────────────────────────────────────
@@ -94,21 +109,72 @@ SUBTYPE_REFINE = {
     "Small":      "Deployable",
 }
 
+# parse_item interns Type/SubType; the identifier-like literal keys above
+# are already interned by the compiler, so lookups hit on identity
+_intern = sys.intern
+
+# Bound lookups for the per-item paths (one global load instead of
+# global + attribute on each call)
+_get_subtype_cat = SUBTYPE_REFINE.get
+_get_type_cat    = TYPE_CATEGORY.get
+_get_mfr_name    = MFR_NAMES.get
+
+@functools.lru_cache(maxsize=None)
 def _display_category(item_type, subtype):
-    if subtype in SUBTYPE_REFINE:
-        return SUBTYPE_REFINE[subtype]
-    return TYPE_CATEGORY.get(item_type, item_type or "Other")
+    # SUBTYPE_REFINE values are all non-empty, so `or` falls through on a miss
+    return _get_subtype_cat(subtype) or _get_type_cat(item_type, item_type or "Other")
 
 
 # ── Parser ────────────────────────────────────────────────────────────────────
+_PLACEHOLDER = frozenset({"@LOC_UNINITIALIZED", "@LOC_EMPTY"})
+# Dev-placeholder loc values, matched case-insensitively without upper()
+# copies (the displayName fallback only rejects PLACEHOLDER)
+_BAD_LOC_RE     = re.compile(r"PLACEHOLDER|UNINITIALIZED", re.IGNORECASE)
+_PLACEHOLDER_RE = re.compile(r"PLACEHOLDER", re.IGNORECASE)
+
+# The same loc keys recur across many items — memoize each key's resolved
+# name against the index last passed in (caches dropped if it changes).
+# Index keys are already lowercase (build_localization_index).
+_LOC_IDX = {}
+
+def _use_loc_idx(loc_idx):
+    global _LOC_IDX
+    if loc_idx is not _LOC_IDX:
+        _LOC_IDX = loc_idx
+        _attach_name.cache_clear()
+        _display_name.cache_clear()
+
+
+@functools.lru_cache(maxsize=8192)
+def _attach_name(k):
+    """Display name for an AttachDef Localization Name key, or ''."""
+    if k and k.startswith("@") and k not in _PLACEHOLDER:
+        val = _LOC_IDX.get(k[1:].lower(), "")
+        if val and not _BAD_LOC_RE.search(val):
+            return val.replace("\\n", " ").strip()
+    return ""
+
+
+@functools.lru_cache(maxsize=8192)
+def _display_name(dn):
+    """Display name for a displayName key (purchasable params), or ''."""
+    if dn and dn.startswith("@") and dn not in _PLACEHOLDER:
+        val = _LOC_IDX.get(dn[1:].lower(), "")
+        if val and not _PLACEHOLDER_RE.search(val):
+            return val.replace("\\n", " ").strip()
+    return ""
+
+
 def parse_item(path, category_hint, mfr_idx, loc_idx):
-    try:
-        root = ET.parse(path).getroot()
-    except Exception:
-        return None
+    """Parse one item XML. Returns info dict or None on error.
 
+    One streaming pass over start events (everything needed is an
+    attribute) covers both the AttachDef and the displayName fallback.
+    Lookups stop once nothing later in the file can change the result, but
+    the parse still runs to EOF so malformed files are rejected as before.
+    """
     info = {
-        "file":      path.stem,
+        "file":      _stem(path),
         "name":      "",
         "type":      "",
         "subtype":   "",
@@ -120,88 +186,192 @@ def parse_item(path, category_hint, mfr_idx, loc_idx):
         "mfr_code":  "",
         "category":  category_hint,
         "display_cat": "",
+        "_name_lc":  "",
     }
 
-    # AttachDef
-    for el in root.iter():
-        if "AttachDef" not in el.tag and el.tag != "AttachDef":
-            continue
-        info["type"]    = el.get("Type", "")
-        info["subtype"] = el.get("SubType", "")
-        info["size"]    = el.get("Size", "")
-        info["grade"]   = el.get("Grade", "")
-        info["tags"]    = el.get("Tags", "")
-
-        # Manufacturer
-        mfr_uuid = el.get("Manufacturer", "")
-        if mfr_uuid and mfr_uuid != "00000000-0000-0000-0000-000000000000":
-            code = mfr_idx.get(mfr_uuid, "")
-            info["mfr_code"] = code
-            info["mfr"] = MFR_NAMES.get(code, code)
-
-        # microSCU
-        for sub in el.iter():
-            v = sub.get("microSCU")
-            if v:
-                try:
-                    info["micro_scu"] = int(v)
-                except (ValueError, TypeError):
-                    pass
-                break
-
-        # Name from Localization child
-        for sub in el.iter():
-            if "Localization" in sub.tag:
-                k = sub.get("Name", "")
-                if k and k.startswith("@") and k not in ("@LOC_UNINITIALIZED", "@LOC_EMPTY"):
-                    key = k[1:].lower()
-                    val = loc_idx.get(key, "")
-                    if val and "PLACEHOLDER" not in val.upper() and "UNINITIALIZED" not in val.upper():
-                        info["name"] = val.replace("\\n", " ").strip()
-                break
-        break
-
-    # Fallback name from SCItemPurchasableParams.displayName
+    _use_loc_idx(loc_idx)
+
+    depth         = 0
+    attach_depth  = 0       # depth of the first AttachDef, 0 = not seen yet
+    attach_open   = False   # still inside it
+    scu_done      = False   # first microSCU inside it taken
+    loc_done      = False   # first Localization inside it taken
+    fallback_name = ""      # first usable displayName anywhere
+    settled       = False   # result final; only well-formedness left to check
+
+    try:
+        for event, el in ET.iterparse(str(path), events=("start", "end"), **_PARSE_KW):
+            if event == "end":
+                if settled:
+                    el.clear()
+                    continue
+                if attach_open and depth == attach_depth:
+                    attach_open = False
+                    # Fallback name is only needed if AttachDef gave none
+                    if info["name"] or fallback_name:
+                        settled = True
+                depth -= 1
+                el.clear()
+                continue
+
+            if settled:
+                continue
+            depth += 1
+            tag = el.tag
+
+            # AttachDef (first one only); its own attributes count as a
+            # descendant for the microSCU search, as el.iter() did
+            if not attach_depth and "AttachDef" in tag:
+                attach_depth = depth
+                attach_open  = True
+                # A handful of distinct values each: interned, so the
+                # category lookups compare by identity
+                info["type"]    = _intern(el.get("Type", ""))
+                info["subtype"] = _intern(el.get("SubType", ""))
+                info["size"]    = _intern(el.get("Size", ""))
+                info["grade"]   = _intern(el.get("Grade", ""))
+                info["tags"]    = el.get("Tags", "")
+
+                # Manufacturer
+                mfr_uuid = el.get("Manufacturer", "")
+                if mfr_uuid and mfr_uuid != "00000000-0000-0000-0000-000000000000":
+                    code = mfr_idx.get(mfr_uuid, "")
+                    info["mfr_code"] = code
+                    info["mfr"] = _get_mfr_name(code, code)
+
+            if attach_open:
+                # microSCU
+                if not scu_done:
+                    v = el.get("microSCU")
+                    if v:
+                        scu_done = True
+                        try:
+                            info["micro_scu"] = int(v)
+                        except (ValueError, TypeError):
+                            pass
+                # Name from Localization child
+                if not loc_done and "Localization" in tag:
+                    loc_done = True
+                    info["name"] = _attach_name(el.get("Name", ""))
+                # Both AttachDef lookups settled with a real name: nothing
+                # later in the file can change the result
+                if scu_done and info["name"]:
+                    settled = True
+                    continue
+
+            # Fallback name from SCItemPurchasableParams.displayName (moot
+            # once the AttachDef Localization gave a name)
+            if not fallback_name and not info["name"]:
+                fallback_name = _display_name(el.get("displayName", ""))
+                if fallback_name and attach_depth and not attach_open and not info["name"]:
+                    settled = True
+    except Exception:
+        return None
+
     if not info["name"]:
-        for el in root.iter():
-            dn = el.get("displayName", "")
-            if dn and dn.startswith("@") and dn not in ("@LOC_UNINITIALIZED", "@LOC_EMPTY"):
-                val = loc_idx.get(dn[1:].lower(), "")
-                if val and "PLACEHOLDER" not in val.upper():
-                    info["name"] = val.replace("\\n", " ").strip()
-                    break
+        info["name"] = fallback_name
+    # Lowercased once here for dedup, sorting and the card's data-name
+    info["_name_lc"] = info["name"].lower()
 
     info["display_cat"] = _display_category(info["type"], info["subtype"])
     return info
 
 
 # ── Scanner ───────────────────────────────────────────────────────────────────
-def scan_all_items(mfr_idx, loc_idx):
-    seen_names = set()
-    items = []
+# Indexes are sent once per worker via the pool initializer instead of being
+# pickled with every task.
+_WORKER_IDX = ()
+
+def _init_worker(mfr_idx, loc_idx):
+    global _WORKER_IDX
+    _WORKER_IDX = (mfr_idx, loc_idx)
 
+
+def _parse_in_worker(task):
+    path, cat_hint = task
+    return parse_item(path, cat_hint, *_WORKER_IDX)
+
+
+# Below this many files starting workers and unpickling the indexes into
+# each costs more than parsing in-process
+_POOL_MIN_FILES = 200
+_CHUNKSIZE      = 32
+
+
+def _parse_all(tasks, idx):
+    """Yield parse_item() for each (path, category hint), in order:
+    in-process for a handful of files, else on a pool with no more workers
+    than chunks."""
+    workers = min(61, os.cpu_count() or 1,   # 61 = Windows process pool limit
+                  math.ceil(len(tasks) / _CHUNKSIZE))
+    if len(tasks) < _POOL_MIN_FILES or workers < 2:
+        for path, cat_hint in tasks:
+            yield parse_item(path, cat_hint, *idx)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=idx) as pool:
+        yield from pool.map(_parse_in_worker, tasks, chunksize=_CHUNKSIZE)
+
+
+def _stem(path):
+    """Path(path).stem for a str or Path, without building a Path."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _iter_xml(root):
+    """Yield every *.xml file under root as a str path, in the same order as
+    sorted(Path(root).rglob("*.xml")): entries are sorted per directory and
+    subdirectories are walked in place. os.scandir avoids a Path object and
+    a stat call per entry."""
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda e: os.path.normcase(e.name))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            continue
+        if is_dir:
+            yield from _iter_xml(entry.path)
+        elif os.path.normcase(entry.name).endswith(".xml"):
+            yield entry.path
+
+
+def scan_all_items(mfr_idx, loc_idx):
+    # Collect every non-skipped (path, category hint, type filter) up front
+    # in source order, parse them all (on a process pool when there are
+    # many), then filter and dedup here in that same order (first file with
+    # a given name wins)
+    tasks = []
     for src_path, cat_hint, type_filter in SOURCES:
         if not src_path.exists():
             print(f"  WARNING: not found: {src_path}")
             continue
-        for f in sorted(src_path.rglob("*.xml")):
-            v = parse_item(f, cat_hint, mfr_idx, loc_idx)
-            if not v:
-                continue
-            if _should_skip(f.stem, v["name"]):
-                continue
-            # Apply type filter for carryables
-            if type_filter and v["type"] not in type_filter:
-                continue
-            # Deduplicate by name (skip identical-named duplicates)
-            key = v["name"].lower().strip()
-            if key and key in seen_names:
-                continue
-            if key:
-                seen_names.add(key)
-            items.append(v)
+        for f in _iter_xml(str(src_path)):
+            if not _should_skip(_stem(f)):
+                tasks.append((f, cat_hint, type_filter))
+
+    # Normalized name -> first item with it (dicts keep insertion order)
+    items_by_name = {}
+    if not tasks:
+        return []
+
+    results = _parse_all([t[:2] for t in tasks], (mfr_idx, loc_idx))
+    for (_, _, type_filter), v in zip(tasks, results):
+        if not v or not v["name"]:
+            continue   # no resolved name = dev/placeholder item
+        # Apply type filter for carryables
+        if type_filter and v["type"] not in type_filter:
+            continue
+        # Deduplicate by name (skip identical-named duplicates); names
+        # are non-empty here, so every item has a key
+        key = v["_name_lc"]
+        if key not in items_by_name:
+            items_by_name[key] = v
 
-    return items
+    return list(items_by_name.values())
 
 
 # ── HTML helpers ───────────────────────────────────────────────────────────────
@@ -216,8 +386,7 @@ CAT_COLORS = {
     "Other":          "#546e7a",
 }
 
-def _cat_color(cat):
-    return CAT_COLORS.get(cat, "#546e7a")
+_get_cat_color = CAT_COLORS.get
 
 def _badge(text, color):
     if not text:
@@ -232,25 +401,27 @@ def _kv(k, v):
 
 def item_to_html(v):
     name    = v["name"] or v["file"]
+    name_lc = v["_name_lc"] if v["name"] else name.lower()
     mfr     = v["mfr"] or v["mfr_code"] or "Unknown"
     dcat    = v["display_cat"]
     subtype = v["subtype"]
     tags    = v["tags"]
 
-    cat_badge  = _badge(dcat, _cat_color(dcat))
+    cat_badge  = _badge(dcat, _get_cat_color(dcat, "#546e7a"))
     sub_text   = f" &middot; {subtype}" if subtype and subtype not in dcat else ""
 
-    stats = ""
+    rows = []
     if v["size"]:
-        stats += _kv("Size", v["size"])
+        rows.append(_kv("Size", v["size"]))
     if v["grade"]:
-        stats += _kv("Grade", v["grade"])
+        rows.append(_kv("Grade", v["grade"]))
     if v["micro_scu"]:
-        stats += _kv("microSCU", f'{v["micro_scu"]:,}')
+        rows.append(_kv("microSCU", f'{v["micro_scu"]:,}'))
     if tags:
         # Show first 2 tags max
         tag_list = [t.strip() for t in tags.split() if t.strip()][:2]
-        stats += _kv("Tags", " · ".join(tag_list))
+        rows.append(_kv("Tags", " · ".join(tag_list)))
+    stats = "".join(rows)
 
     stats_html = (
         f'<div class="kv-grid">{stats}</div>'
@@ -261,116 +432,134 @@ def item_to_html(v):
 
     return (
         f'<div class="item-card" '
-        f'data-cat="{cat_key}" data-mfr="{mfr_key}" data-name="{name.lower()}">\n'
-        f'  <div class="card-header">\n'
-        f'    <div class="card-title-row">'
-        f'<span class="item-name">{name}</span>{cat_badge}</div>\n'
-        f'    <div class="card-meta">{mfr}{sub_text}</div>\n'
-        f'  </div>\n'
-        f'  <div class="card-body">{stats_html}</div>\n'
+        f'data-cat="{cat_key}" data-mfr="{mfr_key}" data-name="{name_lc}">'
+        f'<div class="card-header">'
+        f'<div class="card-title-row">'
+        f'<span class="item-name">{name}</span>{cat_badge}</div>'
+        f'<div class="card-meta">{mfr}{sub_text}</div>'
+        f'</div>'
+        f'<div class="card-body">{stats_html}</div>'
         f'</div>'
     )
 
 
-def generate_html(items):
-    valid = [v for v in items if v and v["name"]]
-    count = len(valid)
-    cards = "\n".join(item_to_html(v) for v in valid)
+# ── Page template ─────────────────────────────────────────────────────────────
+# Static pieces are plain module constants built once at import; only the
+# header/controls block is filled in per page (count, version, tab strips).
+# _CSS/_JS stay readable here and are minified into the page.
 
-    # Category tabs
-    cat_counts = Counter(v["display_cat"] for v in valid)
-    cat_tabs = (
-        f'<button class="tab cat-tab active" data-cat="all" onclick="setCatTab(this)">'
-        f'All <span class="tc">{count}</span></button>\n'
-    )
-    for cat in ["Medical / Stim", "Food & Drink", "Melee", "Throwable",
-                "Deployable", "Tool / Gadget", "Misc", "Other"]:
-        c = cat_counts.get(cat, 0)
-        if not c:
-            continue
-        ckey  = cat.lower().replace(" ", "").replace("/", "")
-        color = _cat_color(cat)
-        cat_tabs += (
-            f'<button class="tab cat-tab" data-cat="{ckey}" '
-            f'style="--cc:{color}" onclick="setCatTab(this)">'
-            f'{cat} <span class="tc">{c}</span></button>\n'
-        )
+def _min_css(css):
+    """Drop comments and all optional whitespace from simple CSS."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r" ?([{}:;,]) ?", r"\1", css)
+    return css.replace(";}", "}").strip()
 
-    # Manufacturer tabs
-    mfr_counts = Counter(v["mfr"] or "Unknown" for v in valid)
-    mfr_tabs = (
-        f'<button class="tab mfr-tab active" data-mfr="all" onclick="setMfrTab(this)">'
-        f'All <span class="tc">{count}</span></button>\n'
-    )
-    for mfr, c in sorted(mfr_counts.items()):
-        code = next((v["mfr_code"].lower() for v in valid
-                     if (v["mfr"] or "Unknown") == mfr), "unknown")
-        mfr_tabs += (
-            f'<button class="tab mfr-tab" data-mfr="{code}" onclick="setMfrTab(this)">'
-            f'{mfr} <span class="tc">{c}</span></button>\n'
-        )
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width,initial-scale=1">
-<title>SC Items Reference</title>
-<style>
-  :root {{
+def _min_js(js):
+    """Strip indentation and blank lines. Line breaks are kept, so automatic
+    semicolon insertion and // comments behave exactly as before."""
+    return "\n".join(l.strip() for l in js.splitlines() if l.strip()) + "\n"
+
+
+_CSS = """  :root {
     --bg:     #0d0f14;
     --card:   #161922;
     --border: #2a2f3d;
     --text:   #e8ecf0;
     --muted:  #8892a4;
     --accent: #5b9cf6;
-  }}
-  * {{ box-sizing:border-box; margin:0; padding:0; }}
-  body {{ background:var(--bg); color:var(--text); font:14px/1.5 "Inter","Segoe UI",sans-serif; }}
-  h1 {{ font-size:1.6rem; font-weight:700; letter-spacing:-.02em; }}
-  header {{ padding:20px 24px 12px; border-bottom:1px solid var(--border); }}
-  header .sub {{ color:var(--muted); font-size:.85rem; margin-top:4px; }}
-  .controls {{ display:flex; flex-direction:column; border-bottom:1px solid var(--border); }}
-  .filter-row {{ display:flex; flex-wrap:wrap; align-items:center; gap:8px;
-                 padding:10px 24px; border-bottom:1px solid var(--border); }}
-  .filter-row:last-child {{ border-bottom:none; }}
-  .filter-label {{ font-size:.7rem; font-weight:700; letter-spacing:.06em;
-                   text-transform:uppercase; color:var(--muted); min-width:60px; }}
-  .tabs {{ display:flex; flex-wrap:wrap; gap:6px; flex:1; }}
-  .tab {{ background:var(--card); border:1px solid var(--border); border-radius:6px;
+  }
+  * { box-sizing:border-box; margin:0; padding:0; }
+  body { background:var(--bg); color:var(--text); font:14px/1.5 "Inter","Segoe UI",sans-serif; }
+  h1 { font-size:1.6rem; font-weight:700; letter-spacing:-.02em; }
+  header { padding:20px 24px 12px; border-bottom:1px solid var(--border); }
+  header .sub { color:var(--muted); font-size:.85rem; margin-top:4px; }
+  .controls { display:flex; flex-direction:column; border-bottom:1px solid var(--border); }
+  .filter-row { display:flex; flex-wrap:wrap; align-items:center; gap:8px;
+                 padding:10px 24px; border-bottom:1px solid var(--border); }
+  .filter-row:last-child { border-bottom:none; }
+  .filter-label { font-size:.7rem; font-weight:700; letter-spacing:.06em;
+                   text-transform:uppercase; color:var(--muted); min-width:60px; }
+  .tabs { display:flex; flex-wrap:wrap; gap:6px; flex:1; }
+  .tab { background:var(--card); border:1px solid var(--border); border-radius:6px;
           color:var(--muted); cursor:pointer; font-size:.8rem; padding:5px 12px;
-          transition:all .15s; }}
-  .tab:hover {{ border-color:var(--accent); color:var(--text); }}
-  .tab.active {{ background:var(--accent); border-color:var(--accent); color:#fff; font-weight:600; }}
-  .cat-tab.active {{ background:var(--cc,var(--accent)); border-color:var(--cc,var(--accent)); }}
-  .tc {{ opacity:.7; font-weight:400; }}
-  #search-box {{ background:var(--card); border:1px solid var(--border); border-radius:6px;
-                 color:var(--text); font-size:.85rem; padding:6px 12px; width:220px; }}
-  #search-box:focus {{ outline:none; border-color:var(--accent); }}
-  #vis-count {{ color:var(--muted); font-size:.8rem; white-space:nowrap; }}
-  .grid {{ display:grid; grid-template-columns:repeat(auto-fill,minmax(270px,1fr));
-           gap:12px; padding:18px 24px; }}
-  .item-card {{ background:var(--card); border:1px solid var(--border); border-radius:10px;
-                overflow:hidden; transition:border-color .15s; }}
-  .item-card:hover {{ border-color:var(--accent); }}
-  .card-header {{ padding:10px 14px 8px; border-bottom:1px solid var(--border); }}
-  .card-title-row {{ display:flex; align-items:flex-start; gap:6px; flex-wrap:wrap; margin-bottom:3px; }}
-  .item-name {{ font-weight:600; font-size:.88rem; line-height:1.3; flex:1; min-width:0;
-                overflow-wrap:break-word; }}
-  .badge {{ font-size:.68rem; font-weight:700; border-radius:4px; padding:2px 6px;
-            color:#fff; white-space:nowrap; align-self:flex-start; }}
-  .card-meta {{ font-size:.73rem; color:var(--muted); }}
-  .card-body {{ padding:8px 14px 10px; }}
-  .kv-grid {{ display:grid; grid-template-columns:auto 1fr; gap:2px 14px; }}
-  .k {{ font-size:.78rem; color:var(--muted); }}
-  .v {{ font-size:.78rem; font-weight:500; }}
-  .no-stats {{ font-size:.78rem; color:var(--muted); font-style:italic; }}
-</style>
+          transition:all .15s; }
+  .tab:hover { border-color:var(--accent); color:var(--text); }
+  .tab.active { background:var(--accent); border-color:var(--accent); color:#fff; font-weight:600; }
+  .cat-tab.active { background:var(--cc,var(--accent)); border-color:var(--cc,var(--accent)); }
+  .tc { opacity:.7; font-weight:400; }
+  #search-box { background:var(--card); border:1px solid var(--border); border-radius:6px;
+                 color:var(--text); font-size:.85rem; padding:6px 12px; width:220px; }
+  #search-box:focus { outline:none; border-color:var(--accent); }
+  #vis-count { color:var(--muted); font-size:.8rem; white-space:nowrap; }
+  .grid { display:grid; grid-template-columns:repeat(auto-fill,minmax(270px,1fr));
+           gap:12px; padding:18px 24px; }
+  .item-card { background:var(--card); border:1px solid var(--border); border-radius:10px;
+                overflow:hidden; transition:border-color .15s; }
+  .item-card:hover { border-color:var(--accent); }
+  .card-header { padding:10px 14px 8px; border-bottom:1px solid var(--border); }
+  .card-title-row { display:flex; align-items:flex-start; gap:6px; flex-wrap:wrap; margin-bottom:3px; }
+  .item-name { font-weight:600; font-size:.88rem; line-height:1.3; flex:1; min-width:0;
+                overflow-wrap:break-word; }
+  .badge { font-size:.68rem; font-weight:700; border-radius:4px; padding:2px 6px;
+            color:#fff; white-space:nowrap; align-self:flex-start; }
+  .card-meta { font-size:.73rem; color:var(--muted); }
+  .card-body { padding:8px 14px 10px; }
+  .kv-grid { display:grid; grid-template-columns:auto 1fr; gap:2px 14px; }
+  .k { font-size:.78rem; color:var(--muted); }
+  .v { font-size:.78rem; font-weight:500; }
+  .no-stats { font-size:.78rem; color:var(--muted); font-style:italic; }
+"""
+
+_JS = """var allCards = Array.from(document.querySelectorAll('.item-card'));
+var activeCat = 'all', activeMfr = 'all', searchVal = '';
+function setCatTab(btn) {
+  document.querySelectorAll('.cat-tab').forEach(function(b) { b.classList.remove('active'); });
+  btn.classList.add('active');
+  activeCat = btn.dataset.cat;
+  applyFilters();
+}
+function setMfrTab(btn) {
+  document.querySelectorAll('.mfr-tab').forEach(function(b) { b.classList.remove('active'); });
+  btn.classList.add('active');
+  activeMfr = btn.dataset.mfr;
+  applyFilters();
+}
+document.getElementById('search-box').addEventListener('input', function() {
+  searchVal = this.value.toLowerCase();
+  applyFilters();
+});
+function applyFilters() {
+  var vis = 0;
+  allCards.forEach(function(c) {
+    var cat = activeCat === 'all' || c.dataset.cat === activeCat;
+    var mfr = activeMfr === 'all' || c.dataset.mfr === activeMfr;
+    var s   = !searchVal || c.dataset.name.indexOf(searchVal) !== -1;
+    var show = cat && mfr && s;
+    c.style.display = show ? '' : 'none';
+    if (show) vis++;
+  });
+  document.getElementById('vis-count').textContent =
+    vis + ' item' + (vis !== 1 ? 's' : '');
+}
+applyFilters();
+"""
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width,initial-scale=1">
+<title>SC Items Reference</title>
+<style>""" + _min_css(_CSS) + """</style>
 </head>
 <body>
-<header>
+"""
+
+_HTML_CONTROLS = """<header>
   <h1>Items Reference</h1>
-  <div class="sub">Star Citizen &mdash; {count} items &middot; {GAME_VERSION}
+  <div class="sub">Star Citizen &mdash; {count} items &middot; {game_version}
     &middot; Consumables · Melee · Throwables · Deployables · Tools</div>
 </header>
 <div class="controls">
@@ -389,58 +578,125 @@ def generate_html(items):
   </div>
 </div>
 <div class="grid" id="grid">
-{cards}
+"""
+
+_HTML_MID = """
 </div>
 <script>
-var allCards = Array.from(document.querySelectorAll('.item-card'));
-var activeCat = 'all', activeMfr = 'all', searchVal = '';
-function setCatTab(btn) {{
-  document.querySelectorAll('.cat-tab').forEach(function(b) {{ b.classList.remove('active'); }});
-  btn.classList.add('active');
-  activeCat = btn.dataset.cat;
-  applyFilters();
-}}
-function setMfrTab(btn) {{
-  document.querySelectorAll('.mfr-tab').forEach(function(b) {{ b.classList.remove('active'); }});
-  btn.classList.add('active');
-  activeMfr = btn.dataset.mfr;
-  applyFilters();
-}}
-document.getElementById('search-box').addEventListener('input', function() {{
-  searchVal = this.value.toLowerCase();
-  applyFilters();
-}});
-function applyFilters() {{
-  var vis = 0;
-  allCards.forEach(function(c) {{
-    var cat = activeCat === 'all' || c.dataset.cat === activeCat;
-    var mfr = activeMfr === 'all' || c.dataset.mfr === activeMfr;
-    var s   = !searchVal || c.dataset.name.indexOf(searchVal) !== -1;
-    var show = cat && mfr && s;
-    c.style.display = show ? '' : 'none';
-    if (show) vis++;
-  }});
-  document.getElementById('vis-count').textContent =
-    vis + ' item' + (vis !== 1 ? 's' : '');
-}}
-applyFilters();
-</script>
+"""
+
+_HTML_TAIL = _min_js(_JS) + """</script>
 </body>
 </html>"""
 
 
-def run():
-    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+def generate_html(items):
+    """Return the full page as one string (see write_html)."""
+    buf = io.StringIO()
+    write_html(items, buf)
+    return buf.getvalue()
+
 
+def write_html(items, fp):
+    """Write the page to fp piece by piece: head, one card at a time, tail.
+    Never holds the joined cards or the whole page as a single string."""
+    valid = [v for v in items if v and v["name"]]
+    count = len(valid)
+
+    # Category tabs
+    cat_counts = Counter(v["display_cat"] for v in valid)
+    tabs = [
+        f'<button class="tab cat-tab active" data-cat="all" onclick="setCatTab(this)">'
+        f'All <span class="tc">{count}</span></button>\n'
+    ]
+    for cat in ["Medical / Stim", "Food & Drink", "Melee", "Throwable",
+                "Deployable", "Tool / Gadget", "Misc", "Other"]:
+        c = cat_counts.get(cat, 0)
+        if not c:
+            continue
+        ckey  = cat.lower().replace(" ", "").replace("/", "")
+        color = _get_cat_color(cat, "#546e7a")
+        tabs.append(
+            f'<button class="tab cat-tab" data-cat="{ckey}" '
+            f'style="--cc:{color}" onclick="setCatTab(this)">'
+            f'{cat} <span class="tc">{c}</span></button>\n'
+        )
+    cat_tabs = "".join(tabs)
+
+    # Manufacturer tabs
+    # Each maker's filter key is the code of its first item; makerless items
+    # share "unknown", the same key item_to_html puts on their cards
+    mfr_counts  = Counter()
+    mfr_to_code = {}
+    for v in valid:
+        mfr = v["mfr"] or "Unknown"
+        mfr_counts[mfr] += 1
+        mfr_to_code.setdefault(mfr, (v["mfr_code"] or "unknown").lower())
+    tabs = [
+        f'<button class="tab mfr-tab active" data-mfr="all" onclick="setMfrTab(this)">'
+        f'All <span class="tc">{count}</span></button>\n'
+    ]
+    for mfr, c in sorted(mfr_counts.items()):
+        code = mfr_to_code.get(mfr, "unknown")
+        tabs.append(
+            f'<button class="tab mfr-tab" data-mfr="{code}" onclick="setMfrTab(this)">'
+            f'{mfr} <span class="tc">{c}</span></button>\n'
+        )
+    mfr_tabs = "".join(tabs)
+
+    fp.write(_HTML_HEAD)
+    fp.write(_HTML_CONTROLS.format(count=count, game_version=settings.GAME_VERSION,
+                                   cat_tabs=cat_tabs, mfr_tabs=mfr_tabs))
+    for n, v in enumerate(valid):
+        if n:
+            fp.write("\n")
+        fp.write(item_to_html(v))
+    fp.write(_HTML_MID)
+    fp.write(_HTML_TAIL)
+
+
+# ── Index cache ───────────────────────────────────────────────────────────────
+# The localization and manufacturer indexes are rebuilt from the same files
+# on every run; keep each one pickled in LOGS_DIR, valid for one game version
+# and one snapshot of its source files.
+
+def _cached(name, builder, sources):
+    """builder() result, loaded from LOGS_DIR/.<name>.pkl while GAME_VERSION
+    and the sources' signature are unchanged."""
+    sig = _source_sig(sources)
+    if sig is None:
+        return builder()
+    key = (settings.GAME_VERSION, sig)
+    path = LOGS_DIR / f".{name}.pkl"
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data.get("key") == key:
+            print(f"  {len(data['index']):,} {name} entries (cached)")
+            return data["index"]
+    except Exception:
+        pass
+    index = builder()
+    tmp = path.with_suffix(".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump({"key": key, "index": index}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+    return index
+
+
+def run():
     print("Items: loading indexes...")
     sys.stdout.flush()
-    loc_idx = build_localization_index()
-    mfr_idx = build_mfr_index()
+    loc_idx = _cached("loc_idx", build_localization_index, [LOC_INI])
+    mfr_idx = _cached("mfr_idx", build_mfr_index, [RECORDS_DIR / "scitemmanufacturer"])
 
     print("  Scanning item XMLs...")
     sys.stdout.flush()
     items = scan_all_items(mfr_idx, loc_idx)
-    items.sort(key=lambda v: (v["display_cat"], v["name"].lower()))
+    items.sort(key=lambda v: (v["display_cat"], v["_name_lc"]))
 
     valid = [v for v in items if v["name"]]
     print(f"  {len(valid)} items (after dedup + name filter)")
@@ -451,10 +707,10 @@ def run():
         print(f"    {cat}: {c}")
     sys.stdout.flush()
 
-    out  = REPORTS_DIR / "items_preview.html"
-    html = generate_html(items)
-    out.write_text(html, encoding="utf-8")
-    print(f"  Written: {out.name} ({len(html):,} bytes)")
+    out = REPORTS_DIR / "items_preview.html"
+    with open(out, "w", encoding="utf-8", buffering=1 << 20) as fp:
+        write_html(items, fp)
+    print(f"  Written: {out.name} ({out.stat().st_size:,} bytes)")
     sys.stdout.flush()
 
 
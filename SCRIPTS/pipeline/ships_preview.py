@@ -4,12 +4,14 @@ Parses ALL loadout entries per ship, resolves every linked entity,
 outputs a self-contained HTML review file.
 """
 
+import os
 import sys
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from config.settings import OUTPUT_DIR, REPORTS_DIR, GAME_VERSION
+from config import settings   # settings.GAME_VERSION: read on use, not at import
+from config.settings import OUTPUT_DIR, REPORTS_DIR
 
 RECORDS_DIR = OUTPUT_DIR / "Data" / "Libs" / "foundry" / "records"
 SHIPS_DIR   = RECORDS_DIR / "entities" / "spaceships"
@@ -186,6 +188,32 @@ def build_localization_index():
     print(f"  {len(index):,} localization strings loaded")
     return index
 
+
+def _source_sig(sources):
+    """(mtime_ns, size/count) per source file or directory tree, or None if
+    any source is missing (nothing worth caching then). The report scripts'
+    pickle caches key on this to notice changed index inputs."""
+    sig = []
+    for src in sources:
+        try:
+            st = os.stat(src)
+        except OSError:
+            return None
+        if not os.path.isdir(src):
+            sig.append((st.st_mtime_ns, st.st_size))
+            continue
+        # Files rewritten in place don't touch the directory mtime
+        newest, n = st.st_mtime_ns, 0
+        for f in Path(src).rglob("*.xml"):
+            try:
+                newest = max(newest, f.stat().st_mtime_ns)
+            except OSError:
+                continue
+            n += 1
+        sig.append((newest, n))
+    return tuple(sig)
+
+
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
 def resolve_entity(class_name, class_ref, uuid_idx, cls_idx):
@@ -1067,7 +1095,7 @@ code.sec-other   {{ color:#8b949e; }}
 </head>
 <body>
 <h1>&#x1F680; SC DataPack — Ships</h1>
-<p class="subtitle">All loadout ports resolved &nbsp;·&nbsp; base loadouts only &nbsp;·&nbsp; {count} ships &nbsp;·&nbsp; {GAME_VERSION}</p>
+<p class="subtitle">All loadout ports resolved &nbsp;·&nbsp; base loadouts only &nbsp;·&nbsp; {count} ships &nbsp;·&nbsp; {settings.GAME_VERSION}</p>
 <div class="mfr-bar">{tabs_html}</div>
 <div class="search-row">
   <input id="ship-search" type="text" placeholder="Search ship name..." oninput="applyFilters()">
@@ -1103,7 +1131,6 @@ function applyFilters() {{
 
 
 def run():
-    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
     uuid_idx  = build_uuid_index()
     cls_idx   = build_classname_index()
     mfr_idx   = build_manufacturer_index(uuid_idx)
@@ -20,7 +20,8 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from config.settings import OUTPUT_DIR, REPORTS_DIR, GAME_VERSION
+from config import settings   # settings.GAME_VERSION: read on use, not at import
+from config.settings import OUTPUT_DIR, REPORTS_DIR
 
 RECORDS_DIR      = OUTPUT_DIR / "Data" / "Libs" / "foundry" / "records"
 SHIP_WEAPONS_DIR = RECORDS_DIR / "entities" / "scitem" / "ships" / "weapons"
@@ -655,7 +656,7 @@ h1{{font-size:1.3rem;font-weight:600;color:#e6edf3}}
 
 <div class="page-header">
   <h1>SC Weapons Reference</h1>
-  <div class="version-tag">{GAME_VERSION}</div>
+  <div class="version-tag">{settings.GAME_VERSION}</div>
   <span class="count-badge">{n_ship} ship weapons</span>
   <span class="count-badge">{n_fps} FPS weapons</span>
   <span class="count-badge">{n_att} attachments</span>
@@ -757,8 +758,6 @@ function applyAtt()  {{ applyFilter('grid-att',  'vis-att',  'atype', 'atype-tab
 
 def run():
     t0 = time.time()
-    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-
     print("Loading localization...")
     sys.stdout.flush()
     loc_idx = build_loc_index()
@@ -79,25 +79,32 @@ def _ensure_venv():
         # old numpy pin). Install from GitLab HEAD with --ignore-requires-python,
         # then install all deps separately with no version pins so binary wheels
         # are used (avoids MSVC requirement for pycryptodome etc.)
+        # pip's stdout is discarded; stderr is kept only to show on failure
         result = subprocess.run(
             [str(VENV_PYTHON), "-m", "pip", "install",
              "git+https://gitlab.com/scmodding/frameworks/scdatatools.git",
              "--no-deps", "--ignore-requires-python", "--quiet"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
         )
         if result.returncode != 0:
+            print(result.stderr)
             print("ERROR: Failed to install scdatatools from GitLab.")
             print("Check your internet connection and try again.")
             sys.exit(1)
 
-        subprocess.run(
+        result = subprocess.run(
             [str(VENV_PYTHON), "-m", "pip", "install",
              "fnvhash", "hexdump", "humanize", "numpy", "packaging",
              "pycryptodome", "pyquaternion", "pyrsi", "rich", "tqdm",
              "xxhash", "zstandard", "line_profiler", "Pillow",
-             "python-nubia", "sentry-sdk",
+             "python-nubia", "sentry-sdk", "lxml",
              "--quiet"],
-            check=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
         )
+        if result.returncode != 0:
+            print(result.stderr)
+            print("ERROR: Failed to install scdatatools dependencies.")
+            sys.exit(1)
 
         print("Setup complete.")
         sys.stdout.flush()
@@ -147,7 +154,6 @@ def _run_step(name, script):
 
 def _write_index():
     """Generate HTML/index.html linking to all reports."""
-    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
     links = ""
     for filename, title, desc in REPORT_FILES:
         exists = (REPORTS_DIR / filename).exists()